@@ -0,0 +1,299 @@
+import argparse
+import contextlib
+import copy
+import json
+import os
+import platform
+import queue
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Any, Optional, List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Suíte de benchmarks de renderização sem display nem chave de API.
+# Cada cenário monta uma cena real sobre um Game com tela fora do display e mede
+# ms por frame (update + render) e alocações por frame; o resultado vai para um JSON
+# que pode ser comparado com o baseline guardado, falhando quando algum cenário regride.
+# Uso: python -m benchmarks.suite [--frames N] [--output report.json] [--baseline benchmarks/baseline.json]
+#                                 [--threshold 0.5] [--update-baseline] [--only nome]
+
+SCREEN_SIZE = (1280, 800)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+ALLOCATION_FRAMES = 50
+WARMUP_STEPS = 10
+REPEATS = 3
+TOKEN = "lorem "
+
+
+class BenchmarkChat:
+    # fonte de tokens local: o benchmark mede a cena, não a API
+    def __init__(self):
+        self.token_queue: queue.Queue = queue.Queue()
+        self.generating = True
+
+    def is_generating(self) -> bool:
+        return self.generating
+
+    def submit(self, text):
+        pass
+
+    def warm_up(self):
+        pass
+
+
+def make_game():
+    from src.engine.Game import Game
+    from src.model.scenario import DEFAULT_SCENARIO
+
+    class BenchmarkGame(Game):
+        def load_options(self) -> Dict[str, Any]:
+            return {"api_key": None, "gpt_model": "benchmark"}
+
+    game = BenchmarkGame(DEFAULT_SCENARIO, start_player=make_player())
+    game.screen = pygame.Surface(SCREEN_SIZE)
+    game.chat = BenchmarkChat()
+    return game
+
+
+def make_player():
+    from src.model.attribs import random_attribs
+    from src.model.classes import CLASS_FACTORY, CharacterClassEnum
+    from src.model.player import Player
+    from src.model.race import CharacterRace
+    from src.model.skills import SKILL_FACTORY, SkillEnum
+
+    player = Player("Benchmark", CLASS_FACTORY[CharacterClassEnum.WARRIOR], CharacterRace.HUMAN, random_attribs(), [SKILL_FACTORY[skill] for skill in list(SkillEnum)[:3]], [])
+    # ninguém morre durante a medição, a cena fica estável
+    player.health = player.max_health = 10 ** 9
+    return player
+
+
+def chat_scene(lines: int):
+    def build(game):
+        from src.engine.scene.ChatScene import ChatScene
+        scene = ChatScene(game.screen, game, game.scenario)
+        text_area = scene.actual_text
+        chunk = 1000
+        for start in range(0, lines, chunk):
+            text_area.append_text("".join(f"line {i} " + TOKEN * 8 + "\n" for i in range(start, min(lines, start + chunk))))
+            # o leitor acompanha o fim do texto, como no jogo
+            text_area.scroll_offset = text_area.wrapped.max_scroll(text_area._visible_line_count())
+
+        def frame():
+            game.chat.token_queue.put(TOKEN)
+            text_area.scroll_offset = text_area.wrapped.max_scroll(text_area._visible_line_count())
+        return scene, frame
+    return build
+
+
+def chat_agent(game):
+    # turnos inteiros pelo AgentExecutor com o modelo local (fake_llm): mede a cena com o loop do chat,
+    # as ferramentas e a memória rodando ao lado, sem rede
+    from src.engine.ai.lazy_chat import LazyChat
+    from src.engine.scene.ChatScene import ChatScene
+    game.chat = LazyChat(
+        gpt_model="fake",
+        api_key=None,
+        system_prompt=game.scenario.system_prompt,
+        initial_message=game.scenario.initial_message,
+        game=game,
+        backend="fake",
+        fake_llm={"tokens_per_second": 400, "first_token_latency": 0.0}
+    )
+    scene = ChatScene(game.screen, game, game.scenario)
+    messages = ["olho em volta", "vou rolar um dado"]
+    turns = [0]
+
+    def frame():
+        if not scene.loading:
+            scene._submit(messages[turns[0] % len(messages)])
+            turns[0] += 1
+    return scene, frame
+
+
+def combat_scene(enemies: int):
+    def build(game):
+        from src.engine.scene.CombatScene import CombatScene
+        from src.model.combat import Combat
+        from src.model.monster import ENEMY_FACTORY, EnemyEnum
+
+        kinds = list(EnemyEnum)
+        combat = Combat(game=game, enemies=[copy.copy(ENEMY_FACTORY[kinds[i % len(kinds)]]) for i in range(enemies)], fleeable=True)
+        for enemy in combat.enemies:
+            enemy.health = enemy.max_health = 10 ** 9
+        return CombatScene(game.screen, game, combat), None
+    return build
+
+
+def main_menu(game):
+    from src.engine.scene.MainMenu import MainMenu
+    return MainMenu(None, game.screen, game), None
+
+
+def character_creator(game):
+    from src.engine.scene.CharacterCreator import CharacterCreator
+    return CharacterCreator(None, game.screen, game)
+
+
+# nome -> (tipo, construtor); "frames" mede update + render, "build" mede a construção da cena
+SCENARIOS: Dict[str, Any] = {
+    "main_menu_idle": ("frames", main_menu),
+    "chat_stream_1k": ("frames", chat_scene(1_000)),
+    "chat_stream_10k": ("frames", chat_scene(10_000)),
+    "chat_stream_100k": ("frames", chat_scene(100_000)),
+    "chat_agent_fake": ("frames", chat_agent),
+    "combat_1": ("frames", combat_scene(1)),
+    "combat_10": ("frames", combat_scene(10)),
+    "combat_50": ("frames", combat_scene(50)),
+    "character_creator_build": ("build", character_creator),
+}
+
+
+def _p99(times: List[float]) -> float:
+    ordered = sorted(times)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+def _summary(runs: List[List[float]], allocations: List[int], blocks: List[int]) -> Dict[str, float]:
+    # como no timeit, fica a repetição mais rápida: as outras medem ruído da máquina
+    times = min(runs, key=statistics.mean)
+    return {
+        "mean_ms": statistics.mean(times) * 1000,
+        "p99_ms": min(_p99(run) for run in runs) * 1000,
+        "alloc_kb_per_frame": statistics.mean(allocations) / 1024 if allocations else 0.0,
+        "blocks_per_frame": statistics.mean(blocks) if blocks else 0.0,
+        "samples": len(times),
+    }
+
+
+@contextlib.contextmanager
+def _silenced():
+    # o callback de fim de canal do SDL_mixer pega o GIL na thread de áudio, o que derruba
+    # o processo com o tracemalloc ligado; durante a passada de alocação nada toca
+    from src.engine.assets.sounds import TYPEWRITER
+    min_interval = TYPEWRITER.min_interval
+    TYPEWRITER.min_interval = float("inf")
+    if pygame.mixer.get_init():
+        pygame.mixer.stop()
+        while pygame.mixer.get_busy():
+            time.sleep(0.001)
+    try:
+        yield
+    finally:
+        TYPEWRITER.min_interval = min_interval
+
+
+def _run(step: Callable[[], Any], samples: int):
+    for _ in range(WARMUP_STEPS):
+        step()
+    runs = []
+    for _ in range(REPEATS):
+        times = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            step()
+            times.append(time.perf_counter() - start)
+        runs.append(times)
+
+    # segunda passada com tracemalloc: pico alocado dentro de cada passo e blocos que sobraram
+    allocations, blocks = [], []
+    with _silenced():
+        tracemalloc.start()
+        for _ in range(min(samples, ALLOCATION_FRAMES)):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            blocks_before = sys.getallocatedblocks()
+            step()
+            _, peak = tracemalloc.get_traced_memory()
+            allocations.append(peak - before)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+        tracemalloc.stop()
+    return _summary(runs, allocations, blocks)
+
+
+def run_scenario(name: str, frames: int) -> Dict[str, float]:
+    kind, build = SCENARIOS[name]
+    game = make_game()
+    if kind == "build":
+        return _run(lambda: build(game), max(20, frames // 10))
+
+    scene, per_frame = build(game)
+    game.scene = scene
+
+    def step():
+        if per_frame is not None:
+            per_frame()
+        scene.update()
+        scene.render()
+    return _run(step, frames)
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for name, result in report["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        # o p99 é mais ruidoso, tolera o dobro
+        for metric, tolerance in (("mean_ms", threshold), ("p99_ms", threshold * 2)):
+            if reference[metric] > 0 and result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {result[metric]:.3f} ms vs baseline {reference[metric]:.3f} ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless rendering benchmarks")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--output", default="benchmark_report.json")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.5, help="regressão tolerada, 0.5 = 50%%")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--only", action="append", choices=sorted(SCENARIOS))
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scenarios": {},
+    }
+    print(f"{'scenario':<26} {'mean ms':>9} {'p99 ms':>9} {'alloc KB':>9} {'blocks':>8}")
+    for name in args.only or SCENARIOS:
+        result = run_scenario(name, args.frames)
+        report["scenarios"][name] = result
+        print(f"{name:<26} {result['mean_ms']:>9.3f} {result['p99_ms']:>9.3f} {result['alloc_kb_per_frame']:>9.1f} {result['blocks_per_frame']:>8.1f}")
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (run with --update-baseline)")
+        return 0
+    with open(args.baseline, "r") as file:
+        regressions = compare(report, json.load(file), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Tempo de frame do TextAreaShow com a janela cheia de texto, enquanto tokens chegam
+# e o usuário rola. Com o viewport composto o tempo deve ficar plano, independente
+# do tamanho do histórico.
+# Uso: python -m benchmarks.textarea [frames]
+
+SIZES = (100, 1000, 10000)
+TOKEN = "lorem "
+
+
+def run(lines: int, frames: int):
+    from src.engine.ui.TextArea import TextAreaShow
+
+    screen = pygame.display.get_surface()
+    area = TextAreaShow((0, 0), 400, 600, "\n".join(f"linha {i} " + TOKEN * 8 for i in range(lines)))
+    area.scroll_offset = area.wrapped.max_scroll(area._visible_line_count())
+    area.render(screen)
+
+    times = []
+    rendered = area.rendered_lines
+    for frame in range(frames):
+        start = time.perf_counter()
+        area.append_text(TOKEN)
+        # acompanha a última linha, rolando uma linha para cima de vez em quando
+        area.scroll_offset = max(0, area.wrapped.max_scroll(area._visible_line_count()) - (1 if frame % 10 == 5 else 0))
+        area.render(screen)
+        times.append(time.perf_counter() - start)
+    return times, (area.rendered_lines - rendered) / frames
+
+
+def main(frames: int = 500):
+    pygame.init()
+    pygame.display.set_mode((400, 600))
+    print(f"{'lines':>8} {'mean ms':>9} {'p99 ms':>9} {'lines/frame':>12}")
+    for lines in SIZES:
+        times, per_frame = run(lines, frames)
+        p99 = sorted(times)[int(len(times) * 0.99) - 1]
+        print(f"{lines:>8} {statistics.mean(times) * 1000:>9.3f} {p99 * 1000:>9.3f} {per_frame:>12.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -48,7 +48,7 @@ wine python --version
 # Dependências Python
 # ============================
 echo "📦 Instalando dependências Python..."
-wine pip install pygame pyinstaller
+wine pip install pygame numpy pyinstaller
 
 # ============================
 # Limpar builds antigos
@@ -56,6 +56,13 @@ wine pip install pygame pyinstaller
 echo "🧹 Limpando builds antigos..."
 rm -rf build dist *.spec
 
+# ============================
+# Atlas de texturas
+# ============================
+echo "🧩 Gerando atlas de texturas..."
+rm -rf "${ASSETS_DIR}/atlas"
+SDL_VIDEODRIVER=dummy wine python -m src.engine.assets.atlas "$ASSETS_DIR"
+
 # ============================
 # Build
 # ============================
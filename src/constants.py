@@ -4,3 +4,34 @@ DEBUG = bool(os.getenv("GRASS_DEBUG",0))
 #game_config
 IMAGE_SIZE = (400,400)
 START_SKILLS = 3
+#assets
+PRELOAD_FONT_SIZES = (12,24,30,48)
+ASSET_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DERIVED_CACHE_DIR = os.getenv("GRASS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "grass"))
+ATLAS_SHEET_SIZE = 2048
+PRELOAD_WORKERS = 4
+TEXT_CACHE_MAX_ENTRIES = 512
+TYPEWRITER_VARIANTS = 16
+TYPEWRITER_MIN_INTERVAL = 0.02
+PRELOAD_BUDGET = 2.0 # segundos até liberar o menu, o resto continua em segundo plano
+#chat
+TRANSCRIPT_SCROLLBACK = 500 # parágrafos do chat mantidos em memória, os mais antigos vão para o disco
+TRANSCRIPT_PAGE = 100
+TOKEN_DRAIN_BUDGET = 0.004 # segundos por frame para esvaziar a fila de tokens do chat
+TOKEN_BATCH_INTERVAL = 0.01 # o produtor junta tokens por até esse tempo antes de enfileirar, 0 desliga
+TOKEN_BATCH_CHARS = 64
+CHAT_TURN_TIMEOUT = 120.0 # segundos até desistir de uma resposta do modelo
+CHAT_MEMORY_TOKEN_BUDGET = 3000 # tokens do histórico recente enviados a cada turno, o resto vira resumo
+LLM_MAX_CONNECTIONS = 8 # por base_url, no pool compartilhado
+LLM_KEEPALIVE_EXPIRY = 300.0 # segundos que uma conexão ociosa fica aberta esperando o próximo turno
+#frame pacing
+ADAPTIVE_PACING = not bool(os.getenv("GRASS_FIXED_FPS",0))
+IDLE_WAIT_MS = 250 # espera máxima por eventos quando nada está animando
+WAKE_GRACE = 0.5 # segundos em taxa cheia depois de um evento
+HIT_GRID_CELL = 128 # tamanho da célula da grade de hit-testing, em pixels
+#debug
+PROFILER_HISTORY = 600 # frames guardados pelo profiler (overlay e CSV)
+TELEMETRY_PATH = os.getenv("GRASS_TELEMETRY_PATH", "turns.jsonl") # métricas de cada turno do chat, uma linha JSON por turno
+TELEMETRY_MAX_BYTES = 1024 * 1024
+TELEMETRY_BACKUPS = 3
+TELEMETRY_HISTORY = 20 # turnos considerados no resumo do overlay
@@ -1,15 +1,21 @@
 import json
 import os
 import sys
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import time
+from typing import Optional, Dict, Any, TYPE_CHECKING, List
 
 import pygame
 
-from src.engine.ai.chat import Chat
+from src.constants import ADAPTIVE_PACING, IDLE_WAIT_MS, WAKE_GRACE
+from src.engine.ai.lazy_chat import LazyChat
+from src.engine.profiler import PROFILER
+from src.engine.scene.LoadingScene import LoadingScene
 from src.engine.scene.MainMenu import MainMenu
 from src.model.player import Player
 from src.model.scenario import Scenario
 
+WAKE_UP_EVENT = pygame.event.custom_type()
+
 
 class Game:
     def __init__(self,scenario:Scenario,start_player=None):
@@ -20,15 +26,33 @@ class Game:
         self.running = True
         self.clock = pygame.time.Clock()
         self.fps = 60
+        self.adaptive_pacing = ADAPTIVE_PACING
+        self._awake_until = 0.0
         self.options = self.load_options()
         self.player: Optional[Player] = start_player
-        self.chat = Chat(
-            system_prompt=scenario.system_prompt,
-            initial_message=scenario.initial_message,
+        self.chat = self._build_chat()
+
+    def _build_chat(self) -> Optional[LazyChat]:
+        # "llm_backend": "fake" usa o modelo local de src/engine/ai/fake_llm.py, que dispensa a chave
+        backend = self.options.get("llm_backend", "openai")
+        if backend == "openai" and not self.options["api_key"]:
+            return None
+        return LazyChat(
+            system_prompt=self.scenario.system_prompt,
+            initial_message=self.scenario.initial_message,
             api_key=self.options["api_key"],
             gpt_model=self.options["gpt_model"],
+            base_url=self.options.get("base_url"),
+            backend=backend,
+            fake_llm=self.options.get("fake_llm"),
             game=self
-        ) if self.options["api_key"] else None
+        )
+
+    def reload_chat(self):
+        # os clientes da API são do processo (LLM_CLIENTS): trocar chave ou modelo reaproveita as conexões
+        if self.chat is not None:
+            self.chat.cancel()
+        self.chat = self._build_chat()
 
     def change_scene(self,new_scene):
         self.previous_scene = self.scene
@@ -46,29 +70,82 @@ class Game:
 
     def _get_default_options(self):
         return {
-            "api_key": os.environ["debug_api_key"],
-            "gpt_model" : "gpt-4o-mini"
+            "api_key": os.getenv("debug_api_key"),
+            "gpt_model" : "gpt-4o-mini",
+            "llm_backend": "openai"
         }
 
+    def request_redraw(self, seconds: float = WAKE_GRACE):
+        # acorda o loop e mantém a taxa cheia por alguns segundos; pode ser chamado de outras threads
+        self._awake_until = max(self._awake_until, time.time() + seconds)
+        try:
+            pygame.event.post(pygame.event.Event(WAKE_UP_EVENT))
+        except pygame.error:
+            pass
+
+    def _is_active(self) -> bool:
+        return not self.adaptive_pacing or time.time() < self._awake_until or self.scene.is_animating()
+
+    def _next_events(self, active: bool) -> List[pygame.event.Event]:
+        if active:
+            events = pygame.event.get()
+        else:
+            # ocioso: bloqueia até chegar um evento ou passar o timeout
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        if events:
+            self._awake_until = max(self._awake_until, time.time() + WAKE_GRACE)
+        return events
+
     def start(self):
+        rendered_scene = None
         while self.running:
             if self.scene is None:
+                # sem cena não há o que desenhar, só espera por eventos
+                for event in self._next_events(False):
+                    if event.type == pygame.QUIT:
+                        self.running = False
                 continue
-            for event in pygame.event.get():
+            PROFILER.begin_frame()
+            scene_name = type(self.scene).__name__
+            active = self._is_active()
+            for event in self._next_events(active):
                 if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
                     self.running = False
-                self.scene.handle_event(event)
+                if PROFILER.handle_event(event):
+                    # o overlay cobre parte da tela; ao desligar a cena precisa redesenhar tudo
+                    self.scene.invalidate()
+                    continue
+                with PROFILER.measure(f"{scene_name}.handle_event"):
+                    self.scene.handle_event(event)
 
-            self.scene.update()
-            self.scene.render()
-            pygame.display.flip()
-            self.clock.tick(self.fps)
+            with PROFILER.measure(f"{scene_name}.update"):
+                self.scene.update()
+            if self.scene is not rendered_scene:
+                # a tela ainda tem o frame da cena anterior
+                self.scene.invalidate()
+                rendered_scene = self.scene
+            with PROFILER.measure(f"{scene_name}.render"):
+                dirty = self.scene.render()
+            overlay = PROFILER.render(self.screen)
+            if overlay is not None and dirty is not None:
+                dirty.append(overlay)
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            self.clock.tick(self.fps if active else 0)
 
         pygame.quit()
         sys.exit()
 
+    def loading_screen(self):
+        self.scene = LoadingScene(self.screen,self,on_done=self.main_menu)
+
     def main_menu(self):
         self.scene = MainMenu(None,self.screen,self)
+        if self.chat is not None:
+            self.chat.warm_up()
 
     def back_scene(self):
         actual_scene = self.scene
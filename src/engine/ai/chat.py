@@ -1,47 +1,117 @@
-import random
+import asyncio
 import threading
-from typing import Dict, Any
-from uuid import UUID
+import time
+from typing import Dict, Any, Optional, List, Union
 
-import numpy as np
-import pygame
 from langchain_classic.agents import create_openai_tools_agent, AgentExecutor
-from langchain_classic.memory import ConversationBufferMemory
 from langchain_community.chat_message_histories import ChatMessageHistory
-from langchain_core.outputs import LLMResult
 
-from src.constants import DEBUG
+from src.constants import DEBUG, TOKEN_BATCH_INTERVAL, TOKEN_BATCH_CHARS, CHAT_TURN_TIMEOUT
+from src.engine.ai.clients import LLM_CLIENTS
+from src.engine.ai.loop import CHAT_LOOP
+from src.engine.ai.memory import BudgetedMemory
+from src.engine.ai.telemetry import TurnMetrics, TELEMETRY
 from src.engine.ai.tools import PlayerToolkit
+from src.engine.ai.turn import Turn, TurnState, EndOfStream
 import queue
-from langchain_core.callbacks import BaseCallbackHandler
-from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import AIMessage
 
-from src.utils import typewriter_sound
 
-
-# Callback para capturar os tokens e jogar na Fila
-class TokenQueueHandler(BaseCallbackHandler):
-    def __init__(self, chat):
+# Recebe os eventos do stream do agente, joga os tokens na Fila, avança o estado do turno
+# e alimenta as métricas do turno (metrics), gravadas pela telemetria no fim
+# Com batch_interval > 0 os tokens são juntados em pedaços de até batch_interval segundos
+# ou batch_chars caracteres, menos itens na fila para o mesmo texto; se o stream parar,
+# um timer no loop esvazia o buffer quando batch_interval vence
+class TokenQueueHandler:
+    def __init__(self, chat, turn: Optional[Turn] = None, metrics: Optional[TurnMetrics] = None, batch_interval: float = TOKEN_BATCH_INTERVAL, batch_chars: int = TOKEN_BATCH_CHARS):
         self.chat = chat
-
-    def on_llm_new_token(self, token: str, **kwargs) -> None:
-        self.chat.token_queue.put(token)
-
-    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs) -> None:
+        self.turn = turn
+        self.metrics = metrics
+        self.batch_interval = batch_interval
+        self.batch_chars = batch_chars
+        self._buffer: List[str] = []
+        self._buffered_chars = 0
+        self._last_flush = time.perf_counter()
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+    def on_event(self, event: Dict[str, Any]):
+        if self.metrics is not None:
+            self.metrics.on_event(event)
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            content = event["data"]["chunk"].content
+            # pedaços de tool call chegam com o texto vazio
+            if content and isinstance(content, str):
+                self.on_llm_new_token(content)
+        elif kind == "on_chat_model_end":
+            self.flush()
+        elif kind == "on_tool_start":
+            self.on_tool_start(event["name"])
+        elif kind == "on_tool_end":
+            self.on_tool_end()
+
+    def on_llm_new_token(self, token: str):
+        self._set_state(TurnState.STREAMING)
+        if self.batch_interval <= 0:
+            self.chat.put_token(token)
+            return
+        self._buffer.append(token)
+        self._buffered_chars += len(token)
+        if self._buffered_chars >= self.batch_chars or time.perf_counter() - self._last_flush >= self.batch_interval:
+            self.flush()
+        elif self._flush_timer is None:
+            self._schedule_flush()
+
+    def on_tool_start(self, tool_name: str):
+        self.flush()
+        self._set_state(TurnState.RUNNING_TOOL)
         if DEBUG:
-            tool_name = serialized.get('name')
-            self.chat.token_queue.put(f"\n*[Sistema: Executando {tool_name}...]*\n")
+            self.chat.put_token(f"\n*[Sistema: Executando {tool_name}...]*\n")
+
+    def on_tool_end(self):
+        # depois da ferramenta o agente chama o modelo de novo
+        self._set_state(TurnState.AWAITING_FIRST_TOKEN)
+
+    def flush(self):
+        if self._flush_timer is not None:
+            # o lote saiu antes do timer (tamanho, fim do modelo, ferramenta ou fim do turno)
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._last_flush = time.perf_counter()
+        if not self._buffer:
+            return
+        if self.turn is None or not self.turn.cancelled:
+            self.chat.put_token("".join(self._buffer))
+        self._buffer = []
+        self._buffered_chars = 0
+
+    def _schedule_flush(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # fora do loop (chamada síncrona) o lote sai só no próximo token ou no fim do modelo
+            return
+        delay = max(0.0, self._last_flush + self.batch_interval - time.perf_counter())
+        self._flush_timer = loop.call_later(delay, self.flush)
+
+    def _set_state(self, state: TurnState):
+        if self.turn is not None and self.turn.state != state:
+            self.turn.set_state(state)
 
 class Chat:
 
 
-    def __init__(self, gpt_model,api_key, system_prompt, initial_message, game):
+    def __init__(self, gpt_model,api_key, system_prompt, initial_message, game, token_queue: Optional[queue.Queue] = None, base_url: Optional[str] = None,
+                 backend: str = "openai", fake_llm: Optional[Dict[str, Any]] = None):
         self.game = game
+        self.gpt_model = gpt_model
         self.player_toolkit = PlayerToolkit(game)
-        self.token_queue = queue.Queue()
+        self.token_queue = token_queue if token_queue is not None else queue.Queue()
+        self.turn: Optional[Turn] = None
+        self._turn_lock = threading.Lock()
+        # task do turno atual, só lida e escrita na thread do CHAT_LOOP
+        self._task: Optional[asyncio.Task] = None
 
         prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
@@ -50,26 +120,30 @@ class Chat:
             MessagesPlaceholder(variable_name="agent_scratchpad"),
         ])
 
-        # Note que removemos o callback fixo aqui para injetá-lo dinamicamente no submit,
-        # mas mantivemos streaming=True
-        llm = ChatOpenAI(
-            model=gpt_model,
-            temperature=1,
-            api_key=api_key,
-            streaming=True
-        )
+        if backend == "fake":
+            # modelo local e determinístico (options.json "llm_backend": "fake"), sem chave nem rede
+            from src.engine.ai.fake_llm import FakeChatModel
+            llm = FakeChatModel(**(fake_llm or {}))
+        else:
+            # cliente compartilhado: outro Chat ou uma troca de opções reaproveita as conexões abertas
+            llm = LLM_CLIENTS.llm(gpt_model, api_key, base_url)
 
+        # a ficha do jogador não fica mais no histórico: vai atualizada em todo turno como fato fixo
         initial_history = ChatMessageHistory(
             messages=[
-                HumanMessage(f"Player\n{self.game.player.to_text() if self.game.player else 'Default'}"),
                 AIMessage(initial_message)
             ]
         )
 
-        memory = ConversationBufferMemory(
+        memory = BudgetedMemory(
             chat_memory=initial_history,
             memory_key="chat_history",
-            return_messages=True
+            output_key="output",
+            return_messages=True,
+            model=gpt_model,
+            summarizer=llm,
+            pinned=self._pinned_facts,
+            on_summary=game.request_redraw
         )
 
         agent = create_openai_tools_agent(llm, self.player_toolkit.get_tools(), prompt)
@@ -77,27 +151,94 @@ class Chat:
             agent=agent,
             tools=self.player_toolkit.get_tools(),
             memory=memory,
-            verbose=True
+            verbose=DEBUG
         )
 
-    def is_generating(self):
-        return not self.token_queue.empty()
+    @property
+    def memory(self) -> BudgetedMemory:
+        return self.agent_executor.memory
 
-    def submit(self, text):
-        if self.is_generating():
-            return
-
-        stream_handler = TokenQueueHandler(self)
+    def _pinned_facts(self) -> str:
+        facts = [self.game.player.to_text(markdown=False)] if self.game.player else []
+        facts += [f"- {key}: {fact}" for key, fact in self.player_toolkit.pinned_facts.items()]
+        return "\n".join(facts)
 
-        def run_agent():
-            try:
-                config = RunnableConfig(callbacks=[stream_handler])
-                self.agent_executor.invoke({"input": text}, config=config)
+    @property
+    def state(self) -> Optional[TurnState]:
+        return self.turn.state if self.turn is not None else None
 
-            except Exception as e:
-                self.token_queue.put(f"[Erro: {e}]")
+    def is_busy(self) -> bool:
+        turn = self.turn
+        return turn is not None and not turn.finished
 
-        threading.Thread(target=run_agent, daemon=True).start()
+    def is_generating(self):
+        # o turno pode estar esperando o modelo ou rodando ferramentas com a fila vazia
+        return self.is_busy() or not self.token_queue.empty()
+
+    def put_token(self, item: Union[str, EndOfStream]):
+        # chamado da thread do CHAT_LOOP: acorda o loop do jogo, que pode estar parado em event.wait
+        self.token_queue.put(item)
+        self.game.request_redraw()
+
+    def submit(self, text) -> Optional[Turn]:
+        # um turno por vez: dois turnos ao mesmo tempo dividiriam a mesma memória
+        with self._turn_lock:
+            if self.is_busy():
+                return None
+            turn = self.turn = Turn(text)
+
+        CHAT_LOOP.call_soon(self._start_turn, turn)
+        return turn
+
+    def cancel(self) -> bool:
+        # cancela a task: o stream HTTP é fechado na hora e o turno cancelado não entra na memória
+        turn = self.turn
+        if turn is None or turn.finished:
+            return False
+        turn.cancel()
+        CHAT_LOOP.call_soon(self._cancel_task)
+        return True
+
+    def _start_turn(self, turn: Turn):
+        stream_handler = TokenQueueHandler(self, turn, TurnMetrics(turn, self.gpt_model))
+        self._task = asyncio.get_running_loop().create_task(self._run_turn(turn, stream_handler))
+        # o fim do stream vai no callback da task, que roda até quando ela é cancelada antes de começar
+        self._task.add_done_callback(lambda task: self._finish_turn(turn, stream_handler, task))
+        if turn.cancelled:
+            self._task.cancel()
+
+    def _cancel_task(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def _run_turn(self, turn: Turn, stream_handler: TokenQueueHandler):
+        turn.set_state(TurnState.AWAITING_FIRST_TOKEN)
+        try:
+            await asyncio.wait_for(self._stream_turn(turn.text, stream_handler), CHAT_TURN_TIMEOUT)
+            turn.set_state(TurnState.DONE)
+        except asyncio.TimeoutError as e:
+            stream_handler.flush()
+            self.put_token(f"[Erro: sem resposta em {CHAT_TURN_TIMEOUT:.0f}s]")
+            turn.error = e
+            turn.set_state(TurnState.ERROR)
+        except Exception as e:
+            stream_handler.flush()
+            self.put_token(f"[Erro: {e}]")
+            turn.error = e
+            turn.set_state(TurnState.ERROR)
+
+    async def _stream_turn(self, text: str, stream_handler: TokenQueueHandler):
+        async for event in self.agent_executor.astream_events({"input": text}, version="v2"):
+            stream_handler.on_event(event)
+
+    def _finish_turn(self, turn: Turn, stream_handler: TokenQueueHandler, task: asyncio.Task):
+        if task.cancelled():
+            turn.set_state(TurnState.CANCELLED)
+        stream_handler.flush()
+        self.put_token(EndOfStream(turn))
+        TELEMETRY.record(stream_handler.metrics)
+        # o resumo da telemetria mudou no overlay do profiler
+        self.game.request_redraw()
 
 
 
@@ -0,0 +1,113 @@
+import importlib.util
+import threading
+from concurrent.futures import Future
+from typing import Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import httpx
+
+from src.constants import LLM_MAX_CONNECTIONS, LLM_KEEPALIVE_EXPIRY
+from src.engine.ai.loop import CHAT_LOOP
+from src.utils import print_debug
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+# HTTP/2 só com o pacote h2 instalado, senão keep-alive em HTTP/1.1
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class LLMClientRegistry:
+    """
+    Clientes do modelo compartilhados pelo processo inteiro.
+    Cada base_url tem um httpx.AsyncClient com pool de conexões keep-alive, então trocar
+    a chave ou o modelo nas opções, ou criar outro Chat, não refaz o handshake TCP+TLS.
+    Os ChatOpenAI ficam em cache por (base_url, api_key, model).
+    """
+
+    def __init__(self):
+        self._http_clients: Dict[str, httpx.AsyncClient] = {}
+        self._llms: Dict[Tuple[str, str, str], "ChatOpenAI"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.preconnects = 0
+        self.preconnect_failures = 0
+
+    def http_client(self, base_url: Optional[str] = None) -> httpx.AsyncClient:
+        base_url = base_url or DEFAULT_BASE_URL
+        with self._lock:
+            client = self._http_clients.get(base_url)
+            if client is None:
+                client = self._http_clients[base_url] = httpx.AsyncClient(
+                    http2=HTTP2,
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                        keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+                    )
+                )
+            return client
+
+    def llm(self, model: str, api_key: str, base_url: Optional[str] = None) -> "ChatOpenAI":
+        base_url = base_url or DEFAULT_BASE_URL
+        key = (base_url, api_key, model)
+        with self._lock:
+            llm = self._llms.get(key)
+            if llm is not None:
+                self.hits += 1
+                return llm
+            self.misses += 1
+
+        from langchain_openai import ChatOpenAI
+        # os tokens vêm do astream_events, mas streaming=True mantém o stream HTTP
+        llm = ChatOpenAI(
+            model=model,
+            temperature=1,
+            api_key=api_key,
+            base_url=base_url,
+            streaming=True,
+            # o uso de tokens vem no fim do stream, para a telemetria
+            stream_usage=True,
+            http_async_client=self.http_client(base_url)
+        )
+        with self._lock:
+            return self._llms.setdefault(key, llm)
+
+    def preconnect(self, base_url: Optional[str] = None) -> Future:
+        # abre a conexão em segundo plano; ela volta para o pool e o primeiro turno já a encontra pronta
+        return CHAT_LOOP.run(self._preconnect(base_url or DEFAULT_BASE_URL))
+
+    async def _preconnect(self, base_url: str):
+        try:
+            # qualquer resposta serve, o que importa é o handshake
+            await self.http_client(base_url).head(base_url)
+            self.preconnects += 1
+        except httpx.HTTPError as e:
+            self.preconnect_failures += 1
+            print_debug(f"Preconnect to {base_url} failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        pools = {}
+        with self._lock:
+            clients = dict(self._http_clients)
+        for base_url, client in clients.items():
+            # o pool do httpcore não é API pública, na falta dele as contagens ficam zeradas
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            pools[base_url] = {
+                "connections": len(connections),
+                "idle": sum(1 for connection in connections if connection.is_idle()),
+            }
+        return {
+            "http2": HTTP2,
+            "llms": len(self._llms),
+            "hits": self.hits,
+            "misses": self.misses,
+            "preconnects": self.preconnects,
+            "preconnect_failures": self.preconnect_failures,
+            "pools": pools,
+        }
+
+
+LLM_CLIENTS = LLMClientRegistry()
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import random
+import re
+import time
+from typing import List, Optional, Any, Dict, Callable, Tuple, AsyncIterator
+
+from langchain_core.callbacks import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, AIMessage, AIMessageChunk, ToolMessage, HumanMessage
+from langchain_core.outputs import ChatResult, ChatGeneration, ChatGenerationChunk
+
+from src.model.monster import EnemyEnum
+
+NARRATION = [
+    "A estrada de terra se estende entre campos de trigo dourado.",
+    "Um vento frio sopra do norte e traz o cheiro de chuva.",
+    "Ao longe, o sino da vila toca três vezes.",
+    "Um corvo observa você do alto de um carvalho retorcido.",
+    "A taverna está cheia e o bardo afina o alaúde num canto.",
+    "Pegadas recentes cortam a lama em direção à floresta.",
+    "O mercador sorri e mostra os dentes de ouro.",
+    "As tochas tremulam e projetam sombras compridas nas paredes.",
+    "Você ouve passos apressados atrás da porta.",
+    "O céu escurece e as primeiras estrelas aparecem.",
+]
+
+# palavra-chave na última mensagem -> ferramenta do PlayerToolkit e seus argumentos
+RULES: List[Tuple[Tuple[str, ...], str, Callable[[random.Random], Dict[str, Any]]]] = [
+    (("victory:true",), "reward_player", lambda rng: {"gold": rng.randint(5, 50), "xp": rng.randint(10, 100)}),
+    (("lutar", "atacar", "ataco", "combate", "fight", "attack"), "initialize_combat",
+     lambda rng: {"enemies": [rng.choice(list(EnemyEnum)).value for _ in range(rng.randint(1, 3))], "fleeable": True}),
+    (("rolar", "dado", "d20", "roll"), "roll_d20", lambda rng: {"modifier": 0, "roll_type": "normal"}),
+    (("descansar", "dormir", "rest", "sleep"), "player_rest", lambda rng: {"__arg1": ""}),
+    (("ficha", "status", "inventário", "inventario"), "player_consult", lambda rng: {"__arg1": ""}),
+]
+TOKEN_PATTERN = re.compile(r"\S+\s*")
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Modelo de chat local e determinístico, para jogar e medir sem chave nem rede.
+    A resposta depende só da conversa e de seed: palavras-chave do jogador viram chamadas reais
+    às ferramentas do PlayerToolkit (RULES); depois do resultado da ferramenta, ou sem regra, vem narração
+    (as falas de script, em ordem, ou frases sorteadas de NARRATION).
+    O stream respeita first_token_latency e tokens_per_second (0 = sem espera).
+    """
+
+    tokens_per_second: float = 40.0
+    first_token_latency: float = 0.3
+    seed: int = 0
+    script: Optional[List[str]] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "grass-fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        message = self._respond(messages, kwargs.get("tools"))
+        time.sleep(self._response_time(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        message = self._respond(messages, kwargs.get("tools"))
+        await asyncio.sleep(self._response_time(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        message = self._respond(messages, kwargs.get("tools"))
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(self.first_token_latency)
+
+        if message.tool_calls:
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+                for i, call in enumerate(message.tool_calls)
+            ]))
+        else:
+            start = loop.time()
+            for i, token in enumerate(TOKEN_PATTERN.findall(message.text)):
+                # espera até o horário do token, sem acumular o atraso de cada sleep
+                if self.tokens_per_second > 0:
+                    await asyncio.sleep(max(0.0, start + i / self.tokens_per_second - loop.time()))
+                chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+                if run_manager is not None:
+                    await run_manager.on_llm_new_token(token, chunk=chunk)
+                yield chunk
+
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=message.usage_metadata))
+
+    def _respond(self, messages: List[BaseMessage], tools: Optional[List[Dict[str, Any]]]) -> AIMessage:
+        last = messages[-1]
+        text = str(last.text)
+        rng = random.Random(f"{self.seed}:{len(messages)}:{text}")
+        prompt_tokens = sum(len(str(message.text)) for message in messages) // 4
+
+        if isinstance(last, ToolMessage):
+            content = f"{self._narration(rng, messages)} ({last.name or 'ferramenta'}: {text[:80]})"
+        elif "resumo atual:" in text.lower():
+            # pedido de resumo da BudgetedMemory
+            content = f"Resumo: o jogador seguiu viagem e viveu {text.count(chr(10))} momentos desde o último resumo."
+        else:
+            available = {tool["function"]["name"] for tool in tools or [] if "function" in tool}
+            lowered = text.lower()
+            for keywords, name, arguments in RULES:
+                if name in available and any(keyword in lowered for keyword in keywords):
+                    call = {"name": name, "args": arguments(rng), "id": f"call_{rng.getrandbits(32):08x}", "type": "tool_call"}
+                    return AIMessage(content="", tool_calls=[call], usage_metadata=self._usage(prompt_tokens, 10))
+            content = self._narration(rng, messages)
+
+        completion_tokens = len(TOKEN_PATTERN.findall(content))
+        return AIMessage(content=content, usage_metadata=self._usage(prompt_tokens, completion_tokens))
+
+    def _narration(self, rng: random.Random, messages: List[BaseMessage]) -> str:
+        if self.script:
+            turn = sum(1 for message in messages if isinstance(message, HumanMessage))
+            return self.script[(turn - 1) % len(self.script)]
+        return " ".join(rng.sample(NARRATION, rng.randint(2, 5)))
+
+    def _response_time(self, message: AIMessage) -> float:
+        if self.tokens_per_second <= 0:
+            return self.first_token_latency
+        return self.first_token_latency + len(TOKEN_PATTERN.findall(message.text)) / self.tokens_per_second
+
+    @staticmethod
+    def _usage(prompt_tokens: int, completion_tokens: int) -> Dict[str, int]:
+        return {"input_tokens": prompt_tokens, "output_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
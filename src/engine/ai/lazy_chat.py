@@ -0,0 +1,77 @@
+import queue
+import threading
+import time
+from typing import Optional, TYPE_CHECKING
+
+from src.utils import print_debug
+
+if TYPE_CHECKING:
+    from src.engine.ai.chat import Chat
+    from src.engine.ai.turn import Turn
+
+
+# Fachada do Chat: a pilha LangChain/OpenAI só é importada no primeiro uso
+# ou pelo warm_up(), chamado em segundo plano quando o menu aparece
+class LazyChat:
+    def __init__(self, gpt_model, api_key, system_prompt, initial_message, game, base_url=None, backend="openai", fake_llm=None):
+        self._kwargs = {
+            "gpt_model": gpt_model,
+            "api_key": api_key,
+            "base_url": base_url,
+            "backend": backend,
+            "fake_llm": fake_llm,
+            "system_prompt": system_prompt,
+            "initial_message": initial_message,
+            "game": game,
+        }
+        self.token_queue = queue.Queue()
+        self._chat: Optional["Chat"] = None
+        self._lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._chat is not None
+
+    def warm_up(self):
+        if self._warm_thread is not None or self.loaded:
+            return
+        self._warm_thread = threading.Thread(target=self._warm, daemon=True)
+        self._warm_thread.start()
+
+    def get(self) -> "Chat":
+        with self._lock:
+            if self._chat is None:
+                chat_class = self._import_chat()
+                self._chat = chat_class(token_queue=self.token_queue, **self._kwargs)
+            return self._chat
+
+    def is_generating(self) -> bool:
+        return self.loaded and self._chat.is_generating()
+
+    def submit(self, text) -> Optional["Turn"]:
+        return self.get().submit(text)
+
+    def cancel(self) -> bool:
+        return self.loaded and self._chat.cancel()
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+    def _warm(self):
+        self._import_chat()
+        # a codificação do tiktoken carrega numa thread, antes do primeiro turno contar tokens
+        from src.engine.ai.memory import TokenCounter
+        TokenCounter(self._kwargs["gpt_model"]).warm_up()
+        if self._kwargs["backend"] != "openai":
+            return
+        # com a pilha carregada, abre a conexão com a API antes do primeiro turno
+        from src.engine.ai.clients import LLM_CLIENTS
+        LLM_CLIENTS.preconnect(self._kwargs["base_url"])
+
+    @staticmethod
+    def _import_chat():
+        start = time.perf_counter()
+        from src.engine.ai.chat import Chat
+        print_debug(f"AI stack imported in {time.perf_counter() - start:.2f}s")
+        return Chat
@@ -0,0 +1,43 @@
+import asyncio
+import threading
+from typing import Optional, Callable, Any, Coroutine
+from concurrent.futures import Future
+
+from src.utils import print_debug
+
+
+class ChatLoop:
+    """
+    Um event loop asyncio numa thread daemon, criado no primeiro uso e compartilhado por todos os Chats.
+    Os turnos rodam como tasks nele, então cancelar e limitar tempo é só cancelar a task,
+    e várias conversas podem coexistir sem uma thread por mensagem.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, name="chat-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coroutine: Coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call_soon(self, callback: Callable[..., Any], *args):
+        # a ordem das chamadas é preservada: um cancel sempre chega depois do start correspondente
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        print_debug("Chat event loop started")
+        self._loop.run_forever()
+
+
+CHAT_LOOP = ChatLoop()
@@ -0,0 +1,201 @@
+import threading
+from typing import List, Dict, Any, Optional, Callable, Set
+
+from langchain_classic.memory.chat_memory import BaseChatMemory
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, get_buffer_string
+from pydantic import PrivateAttr
+
+from src.constants import CHAT_MEMORY_TOKEN_BUDGET
+from src.engine.ai.loop import CHAT_LOOP
+from src.utils import print_debug
+
+SUMMARY_PROMPT = (
+    "Você mantém o resumo de uma campanha de RPG narrada por um mestre (DM) para um jogador (Player). "
+    "Reescreva o resumo atual incorporando as novas mensagens. Guarde eventos, decisões, lugares, "
+    "personagens e pendências; descarte floreios. Responda só com o novo resumo, em no máximo 300 palavras."
+)
+# tokens extras de cada mensagem no formato de chat (papel e separadores)
+MESSAGE_OVERHEAD = 4
+
+
+class TokenCounter:
+    """
+    Conta tokens com o tiktoken do modelo. A codificação (baixada no primeiro uso) é carregada
+    numa thread própria por warm_up(), que o LazyChat chama junto com o import da pilha de IA;
+    até ela ficar pronta, ou sem ela, vale uma estimativa de 4 caracteres por token,
+    boa o bastante para um orçamento. Assim contar nunca trava a thread do CHAT_LOOP.
+    """
+
+    # codificações por modelo, compartilhadas; None = tiktoken indisponível
+    _encodings: Dict[str, Any] = {}
+    _loading: Set[str] = set()
+    _lock = threading.Lock()
+
+    def __init__(self, model: str):
+        self.model = model
+
+    def count(self, text: str) -> int:
+        encoding = TokenCounter._encodings.get(self.model)
+        if encoding is None:
+            self.warm_up()
+            return len(text) // 4 + 1
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def warm_up(self):
+        with TokenCounter._lock:
+            if self.model in TokenCounter._encodings or self.model in TokenCounter._loading:
+                return
+            TokenCounter._loading.add(self.model)
+        threading.Thread(target=self._load, name="tiktoken", daemon=True).start()
+
+    def _load(self):
+        encoding = None
+        try:
+            import tiktoken
+            try:
+                encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            print_debug(f"tiktoken unavailable, estimating tokens: {e}")
+        with TokenCounter._lock:
+            TokenCounter._encodings[self.model] = encoding
+            TokenCounter._loading.discard(self.model)
+
+
+class BudgetedMemory(BaseChatMemory):
+    """
+    Memória da conversa com orçamento de tokens.
+    Só a janela mais recente do histórico vai no prompt, com até token_budget tokens; a contagem
+    de cada mensagem é feita uma vez e guardada. As mensagens que saem da janela são resumidas
+    pelo summarizer numa task do CHAT_LOOP, fora do turno, e continuam indo no prompt até entrarem no resumo.
+    pinned devolve os fatos fixos (ficha do jogador, missões), lidos de novo a cada turno.
+    on_summary é chamado (na thread do CHAT_LOOP) depois de cada resumo novo.
+    """
+
+    memory_key: str = "chat_history"
+    token_budget: int = CHAT_MEMORY_TOKEN_BUDGET
+    model: str = "gpt-4o-mini"
+    summarizer: Optional[Any] = None
+    pinned: Optional[Callable[[], str]] = None
+    on_summary: Optional[Callable[[], Any]] = None
+    summary: str = ""
+
+    _counter: Optional[TokenCounter] = PrivateAttr(default=None)
+    _counts: Dict[int, int] = PrivateAttr(default_factory=dict)
+    _pending: List[BaseMessage] = PrivateAttr(default_factory=list)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _summarizing: bool = PrivateAttr(default=False)
+    _summaries: int = PrivateAttr(default=0)
+
+    @property
+    def memory_variables(self) -> List[str]:
+        return [self.memory_key]
+
+    def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            history = self._pending + list(self.chat_memory.messages)
+            summary = self.summary
+        header = []
+        pinned = self.pinned() if self.pinned is not None else ""
+        if pinned:
+            header.append(SystemMessage(f"Fatos fixos da campanha (sempre atuais):\n{pinned}"))
+        if summary:
+            header.append(SystemMessage(f"Resumo do que aconteceu antes:\n{summary}"))
+        return {self.memory_key: header + history}
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        super().save_context(inputs, outputs)
+        self._enforce_budget()
+
+    async def asave_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        # o caminho assíncrono do AgentExecutor também passa pelo orçamento
+        await super().asave_context(inputs, outputs)
+        self._enforce_budget()
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._counts.clear()
+            self._pending.clear()
+            self.summary = ""
+
+    def count_tokens(self, message: BaseMessage) -> int:
+        key = id(message)
+        count = self._counts.get(key)
+        if count is None:
+            if self._counter is None:
+                self._counter = TokenCounter(self.model)
+            count = self._counts[key] = self._counter.count(str(message.text)) + MESSAGE_OVERHEAD
+        return count
+
+    def history_tokens(self) -> int:
+        with self._lock:
+            return sum(self.count_tokens(message) for message in self._pending + list(self.chat_memory.messages))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            messages = len(self.chat_memory.messages)
+            pending = len(self._pending)
+        return {
+            "messages": messages,
+            "pending": pending,
+            "history_tokens": self.history_tokens(),
+            "summary_chars": len(self.summary),
+            "summaries": self._summaries,
+        }
+
+    def _enforce_budget(self):
+        with self._lock:
+            messages = self.chat_memory.messages
+            total = sum(self.count_tokens(message) for message in messages)
+            evicted = []
+            # a última troca fica sempre, mesmo acima do orçamento
+            while total > self.token_budget and len(messages) > 2:
+                message = messages.pop(0)
+                total -= self.count_tokens(message)
+                evicted.append(message)
+            if not evicted:
+                return
+            if self.summarizer is None:
+                # sem quem resuma, a janela simplesmente anda
+                self._forget(evicted)
+                return
+            self._pending.extend(evicted)
+            if self._summarizing:
+                return
+            self._summarizing = True
+        CHAT_LOOP.run(self._summarize())
+
+    def _forget(self, messages: List[BaseMessage]):
+        # a contagem é por id: sai do cache junto com a mensagem, antes que o id possa ser reusado
+        for message in messages:
+            self._counts.pop(id(message), None)
+
+    async def _summarize(self):
+        while True:
+            with self._lock:
+                batch = list(self._pending)
+                summary = self.summary
+                if not batch:
+                    self._summarizing = False
+                    return
+            transcript = get_buffer_string(batch, human_prefix="Player", ai_prefix="DM")
+            try:
+                response = await self.summarizer.ainvoke([
+                    SystemMessage(SUMMARY_PROMPT),
+                    HumanMessage(f"Resumo atual:\n{summary or '(vazio)'}\n\nNovas mensagens:\n{transcript}")
+                ])
+            except Exception as e:
+                # as mensagens continuam pendentes (e no prompt); a próxima saída da janela tenta de novo
+                print_debug(f"Memory summary failed: {e}")
+                with self._lock:
+                    self._summarizing = False
+                return
+            with self._lock:
+                self.summary = str(response.text)
+                del self._pending[:len(batch)]
+                self._forget(batch)
+                self._summaries += 1
+            if self.on_summary is not None:
+                self.on_summary()
@@ -0,0 +1,140 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Any, List, Optional, Deque, Tuple
+
+from src.constants import TELEMETRY_PATH, TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS, TELEMETRY_HISTORY
+from src.engine.ai.turn import Turn
+from src.engine.profiler import PROFILER
+
+
+def _payload_size(value: Any) -> int:
+    if value is None:
+        return 0
+    content = getattr(value, "content", value)
+    text = content if isinstance(content, str) else json.dumps(content, default=str)
+    return len(text.encode("utf-8"))
+
+
+class TurnMetrics:
+    """
+    Métricas de um turno, montadas a partir dos eventos do astream_events:
+    chamadas ao modelo (iterações do agente), uso de tokens, latência e tamanho de cada ferramenta.
+    """
+
+    def __init__(self, turn: Turn, model: str):
+        self.turn = turn
+        self.model = model
+        self.iterations = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.chunks = 0
+        self.last_token_at: Optional[float] = None
+        self.tools: List[Dict[str, Any]] = []
+        self._tool_starts: Dict[str, Tuple[float, int]] = {}
+
+    def on_event(self, event: Dict[str, Any]):
+        kind = event["event"]
+        if kind == "on_chat_model_start":
+            self.iterations += 1
+        elif kind == "on_chat_model_stream":
+            self.chunks += 1
+            self.last_token_at = time.perf_counter()
+        elif kind == "on_chat_model_end":
+            # com stream_usage=True o uso chega no último pedaço do stream
+            usage = getattr(event["data"].get("output"), "usage_metadata", None) or {}
+            self.prompt_tokens += usage.get("input_tokens", 0)
+            self.completion_tokens += usage.get("output_tokens", 0)
+            self.total_tokens += usage.get("total_tokens", 0)
+        elif kind == "on_tool_start":
+            self._tool_starts[event["run_id"]] = (time.perf_counter(), _payload_size(event["data"].get("input")))
+        elif kind == "on_tool_end":
+            start, input_bytes = self._tool_starts.pop(event["run_id"], (time.perf_counter(), 0))
+            self.tools.append({
+                "name": event["name"],
+                "latency_s": round(time.perf_counter() - start, 6),
+                "input_bytes": input_bytes,
+                "output_bytes": _payload_size(event["data"].get("output")),
+            })
+
+    def tokens_per_second(self) -> float:
+        first = self.turn.first_token_at
+        if first is None or self.last_token_at is None or self.last_token_at <= first:
+            return 0.0
+        # sem o uso da API conta os pedaços do stream, que são quase sempre um token cada
+        return (self.completion_tokens or self.chunks) / (self.last_token_at - first)
+
+    def to_record(self) -> Dict[str, Any]:
+        turn = self.turn
+        finished = turn.finished_at if turn.finished_at is not None else time.perf_counter()
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "model": self.model,
+            "state": turn.state.value,
+            "error": str(turn.error) if turn.error is not None else None,
+            "wall_s": round(finished - turn.created_at, 4),
+            "ttft_s": round(turn.first_token_at - turn.created_at, 4) if turn.first_token_at is not None else None,
+            "tokens_per_s": round(self.tokens_per_second(), 2),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "iterations": self.iterations,
+            "tool_s": round(sum(tool["latency_s"] for tool in self.tools), 6),
+            "tools": self.tools,
+        }
+
+
+class Telemetry:
+    """
+    Um registro JSONL por turno, num arquivo que gira em max_bytes (logging.RotatingFileHandler).
+    Os últimos turnos ficam em memória e o resumo vai para o overlay do profiler (F3).
+    """
+
+    def __init__(self, path: str = TELEMETRY_PATH, max_bytes: int = TELEMETRY_MAX_BYTES, backups: int = TELEMETRY_BACKUPS, history: int = TELEMETRY_HISTORY):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._logger: Optional[logging.Logger] = None
+        self._lock = threading.Lock()
+
+    def record(self, metrics: TurnMetrics) -> Dict[str, Any]:
+        record = metrics.to_record()
+        with self._lock:
+            self.records.append(record)
+            self._get_logger().info(json.dumps(record, ensure_ascii=False))
+        PROFILER.set_info("llm", self.summary())
+        return record
+
+    def summary(self) -> List[str]:
+        if not self.records:
+            return []
+        last = self.records[-1]
+        ttfts = [record["ttft_s"] for record in self.records if record["ttft_s"] is not None]
+        ttft = f"{last['ttft_s']:.2f}s" if last["ttft_s"] is not None else "-"
+        average = f"{sum(ttfts) / len(ttfts):.2f}s" if ttfts else "-"
+        tools = ", ".join(f"{tool['name']} {tool['latency_s'] * 1000:.0f}ms" for tool in last["tools"][:2])
+        return [
+            f"LLM {last['state']}  ttft {ttft}  avg {average}",
+            f"wall {last['wall_s']:.2f}s  {last['prompt_tokens']}+{last['completion_tokens']} tok  {last['tokens_per_s']:.0f} tok/s  {last['iterations']} it",
+            f"tools {len(last['tools'])}: {tools or '-'}",
+        ]
+
+    def _get_logger(self) -> logging.Logger:
+        if self._logger is None:
+            logger = logging.getLogger("grass.telemetry")
+            logger.setLevel(logging.INFO)
+            # não sobe para o root: o JSONL fica só no arquivo
+            logger.propagate = False
+            handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes, backupCount=self.backups, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+
+TELEMETRY = Telemetry()
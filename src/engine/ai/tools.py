@@ -70,14 +70,24 @@ class GenericItemModel(BaseModel):
 class GiveItems(BaseModel):
     items_ids: List[int]
 
+class PinFact(BaseModel):
+    key: str = Field(description="Short unique name, e.g. quest_lost_sword")
+    fact: str = Field(description="The fact to remember. Empty to forget it")
+
 
 class PlayerToolkit(BaseToolkit):
     _game: "Game" = PrivateAttr()
+    # fatos fixados pelo mestre, vão em todo prompt junto com a ficha (ver BudgetedMemory)
+    _pinned_facts: Dict[str, str] = PrivateAttr(default_factory=dict)
 
     def __init__(self, game: "Game", **data: Any):
         super().__init__(**data)
         self._game = game
 
+    @property
+    def pinned_facts(self) -> Dict[str, str]:
+        return self._pinned_facts
+
     def get_tools(self) -> list[BaseTool]:
         return [
             StructuredTool(
@@ -175,6 +185,12 @@ class PlayerToolkit(BaseToolkit):
                 name="player_consult",
                 description="Consult the player status",
                 func=self.consult_player
+            ),
+            StructuredTool(
+                name="pin_fact",
+                description="Pin a campaign fact that must never be forgotten (active quests, promises, important NPCs and places). Old messages are summarized, pinned facts are always shown. Reusing a key replaces the fact",
+                args_schema=PinFact,
+                func=self.pin_fact
             )
         ]
 
@@ -247,6 +263,13 @@ class PlayerToolkit(BaseToolkit):
     def consult_player(self,aaa):
         return self._game.player.to_text(markdown=True)
 
+    def pin_fact(self,key,fact):
+        if not fact:
+            self._pinned_facts.pop(key,None)
+            return f"Fact {key} forgotten"
+        self._pinned_facts[key] = fact
+        return f"Fact {key} pinned"
+
     def sell_trash(self,_):
         self._game.player.sell_trash()
         return "All golds have been added to the player's sheet automatically"
@@ -0,0 +1,66 @@
+import threading
+import time
+from enum import Enum
+from typing import Optional
+
+class TurnState(str, Enum):
+    QUEUED = "queued"
+    AWAITING_FIRST_TOKEN = "awaiting_first_token"
+    STREAMING = "streaming"
+    RUNNING_TOOL = "running_tool"
+    DONE = "done"
+    ERROR = "error"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATES = frozenset({TurnState.DONE, TurnState.ERROR, TurnState.CANCELLED})
+
+
+class Turn:
+    """
+    Uma mensagem do jogador e a resposta do modelo, do envio até o fim do stream.
+    O estado é escrito no loop do chat e lido pela cena; cancel() pode vir de qualquer thread.
+    Fica neste módulo, sem LangChain, para a cena poder usar sem carregar a pilha de IA.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.state = TurnState.QUEUED
+        self.error: Optional[Exception] = None
+        self.created_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def set_state(self, state: TurnState):
+        if self.finished:
+            return
+        if state == TurnState.STREAMING and self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.state = state
+        if state in FINISHED_STATES:
+            self.finished_at = time.perf_counter()
+
+
+class EndOfStream:
+    """
+    Marcador na fila de tokens: o turno terminou (concluído, com erro ou cancelado).
+    Leva o Turn, para a cena não tomar o fim de um turno antigo, que ficou na fila
+    enquanto ela não era atualizada (combate), pelo fim do turno atual.
+    """
+
+    __slots__ = ("turn",)
+
+    def __init__(self, turn: Turn):
+        self.turn = turn
@@ -0,0 +1,161 @@
+import json
+import os
+import sys
+import threading
+from typing import Dict, List, Tuple, Optional, AnyStr, Any
+
+import pygame
+
+from src.constants import IMAGE_SIZE, ATLAS_SHEET_SIZE
+from src.utils import get_assets_path, print_debug
+
+ATLAS_FOLDER = "atlas"
+INDEX_FILE = "index.json"
+
+# pasta -> tamanho com que os sprites entram no atlas (None = tamanho original)
+ATLAS_SOURCES: Dict[str, Optional[Tuple[int, int]]] = {
+    "entities": IMAGE_SIZE,
+    "items": None,
+}
+
+
+def _pack(sizes: List[Tuple[AnyStr, int, int]], sheet_size: int, padding: int = 1) -> List[Dict[AnyStr, List[int]]]:
+    # Empacotamento em prateleiras: maiores primeiro, da esquerda para a direita
+    sheets: List[Dict[AnyStr, List[int]]] = [{}]
+    x = y = shelf_height = 0
+    for name, w, h in sorted(sizes, key=lambda item: item[2], reverse=True):
+        if w > sheet_size or h > sheet_size:
+            raise ValueError(f"{name} ({w}x{h}) does not fit in a {sheet_size}px sheet")
+        if x + w > sheet_size:
+            x, y, shelf_height = 0, y + shelf_height + padding, 0
+        if y + h > sheet_size:
+            sheets.append({})
+            x = y = shelf_height = 0
+        sheets[-1][name] = [x, y, w, h]
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return sheets
+
+
+def build_atlas(assets_path: AnyStr, sheet_size: int = ATLAS_SHEET_SIZE) -> Dict[str, Any]:
+    images: Dict[AnyStr, pygame.Surface] = {}
+    requested: Dict[AnyStr, Optional[Tuple[int, int]]] = {}
+    for folder, size in ATLAS_SOURCES.items():
+        path = os.path.join(assets_path, folder)
+        if not os.path.isdir(path):
+            continue
+        for name in sorted(os.listdir(path)):
+            if not name.endswith(".png"):
+                continue
+            relative_path = os.path.join(folder, name)
+            image = pygame.image.load(os.path.join(assets_path, relative_path))
+            images[relative_path] = pygame.transform.scale(image, size) if size else image
+            requested[relative_path] = size
+
+    layout = _pack([(name, *image.get_size()) for name, image in images.items()], sheet_size)
+    output = os.path.join(assets_path, ATLAS_FOLDER)
+    os.makedirs(output, exist_ok=True)
+
+    index = {"sheets": [], "sprites": {}}
+    for i, sheet_layout in enumerate(layout):
+        width = max(x + w for x, y, w, h in sheet_layout.values())
+        height = max(y + h for x, y, w, h in sheet_layout.values())
+        sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+        for name, rect in sheet_layout.items():
+            sheet.blit(images[name], rect[:2])
+            index["sprites"][name.replace(os.sep, "/")] = {
+                "sheet": i,
+                "rect": rect,
+                "size": list(requested[name]) if requested[name] else None
+            }
+        sheet_name = f"sheet_{i}.png"
+        pygame.image.save(sheet, os.path.join(output, sheet_name))
+        index["sheets"].append(sheet_name)
+
+    with open(os.path.join(output, INDEX_FILE), "w") as file:
+        json.dump(index, file, indent=2)
+    return index
+
+
+class TextureAtlas:
+    """
+    Sprites de assets/atlas, gerado por build_atlas.
+    Cada folha é decodificada uma vez e os sprites são subsurfaces dela.
+    Sem o índice em disco o atlas fica vazio e o AssetManager cai para os arquivos soltos.
+    """
+
+    def __init__(self):
+        self._index: Optional[Dict[str, Any]] = None
+        self._sheets: Dict[int, pygame.Surface] = {}
+        self._converted: set = set()
+        self._lock = threading.Lock()
+
+    def has(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None) -> bool:
+        return self._entry(relative_path, size) is not None
+
+    def load_sheet(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None):
+        entry = self._entry(relative_path, size)
+        if entry is not None:
+            self._raw_sheet(entry["sheet"])
+
+    def is_loaded(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None) -> bool:
+        entry = self._entry(relative_path, size)
+        return entry is not None and entry["sheet"] in self._sheets
+
+    def sprite(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        entry = self._entry(relative_path, size)
+        if entry is None:
+            return None
+        return self._sheet(entry["sheet"]).subsurface(pygame.Rect(entry["rect"]))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sprites": len(self._get_index()["sprites"]),
+            "sheets_loaded": len(self._sheets),
+            "sheet_bytes": sum(sheet.get_pitch() * sheet.get_height() for sheet in self._sheets.values()),
+        }
+
+    def _get_index(self) -> Dict[str, Any]:
+        if self._index is None:
+            path = os.path.join(get_assets_path(), ATLAS_FOLDER, INDEX_FILE)
+            index = {"sheets": [], "sprites": {}}
+            if os.path.exists(path):
+                with open(path, "r") as file:
+                    index = json.load(file)
+                # o índice usa "/" mas os chamadores usam os.path.join
+                index["sprites"] = {os.path.normpath(name): entry for name, entry in index["sprites"].items()}
+            self._index = index
+        return self._index
+
+    def _entry(self, relative_path: AnyStr, size: Optional[Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+        entry = self._get_index()["sprites"].get(os.path.normpath(relative_path))
+        if entry is None:
+            return None
+        if (tuple(entry["size"]) if entry["size"] else None) != (tuple(size) if size else None):
+            return None
+        return entry
+
+    def _raw_sheet(self, i: int) -> pygame.Surface:
+        with self._lock:
+            sheet = self._sheets.get(i)
+            if sheet is None:
+                sheet = pygame.image.load(os.path.join(get_assets_path(), ATLAS_FOLDER, self._get_index()["sheets"][i]))
+                self._sheets[i] = sheet
+                print_debug(f"Atlas sheet {i} loaded")
+            return sheet
+
+    def _sheet(self, i: int) -> pygame.Surface:
+        sheet = self._raw_sheet(i)
+        # a conversão para o formato do display só pode acontecer na thread principal
+        if i not in self._converted and pygame.display.get_surface() is not None and threading.current_thread() is threading.main_thread():
+            sheet = sheet.convert_alpha()
+            self._sheets[i] = sheet
+            self._converted.add(i)
+        return sheet
+
+
+if __name__ == "__main__":
+    # Uso: python -m src.engine.assets.atlas [pasta_assets]
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    result = build_atlas(sys.argv[1] if len(sys.argv) > 1 else os.path.join(project_root, "assets"))
+    print(f"{len(result['sprites'])} sprites packed into {len(result['sheets'])} sheet(s)")
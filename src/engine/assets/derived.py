@@ -0,0 +1,112 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Tuple, Optional, Callable, AnyStr, Any
+
+import pygame
+
+from src.constants import DERIVED_CACHE_DIR
+from src.utils import print_debug
+
+HEADER = struct.Struct("<4sII")
+MAGIC = b"GRS1"
+
+
+class DerivedCache:
+    """
+    Cache em disco de surfaces derivadas (retratos escalados, máscaras, estados de botão).
+    A chave combina o hash da origem, o tamanho e a cadeia de transformações.
+    Cada entrada é um buffer RGBA cru que é mapeado em memória e embrulhado com
+    pygame.image.frombuffer, sem decodificar nem reamostrar nada num start quente.
+    """
+
+    def __init__(self, directory: AnyStr = DERIVED_CACHE_DIR):
+        self.directory = directory
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._file_hashes: Dict[Tuple[AnyStr, float, int], str] = {}
+
+    def file_hash(self, path: AnyStr) -> str:
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime, stat.st_size)
+        digest = self._file_hashes.get(stamp)
+        if digest is None:
+            with open(path, "rb") as file:
+                digest = hashlib.sha1(file.read()).hexdigest()
+            self._file_hashes[stamp] = digest
+        return digest
+
+    @staticmethod
+    def surface_hash(surface: pygame.Surface) -> str:
+        return hashlib.sha1(pygame.image.tobytes(surface, "RGBA")).hexdigest()
+
+    @staticmethod
+    def key(source_hash: str, size: Optional[Tuple[int, int]], chain: Tuple[Any, ...]) -> str:
+        return hashlib.sha1(repr((source_hash, size, chain)).encode()).hexdigest()
+
+    def get_or_create(self, key: str, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        surface = self.load(key) if self.enabled else None
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = factory()
+        if self.enabled:
+            self.save(key, surface)
+        return surface
+
+    def transform(self, surface: pygame.Surface, strategy) -> pygame.Surface:
+        key = self.key(self.surface_hash(surface), surface.get_size(), (strategy.cache_key(),))
+        return self.get_or_create(key, lambda: strategy.transform(surface))
+
+    def load(self, key: str) -> Optional[pygame.Surface]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, width, height = HEADER.unpack_from(mapped)
+            if magic != MAGIC or len(mapped) != HEADER.size + width * height * 4:
+                mapped.close()
+                return None
+            surface = pygame.image.frombuffer(memoryview(mapped)[HEADER.size:], (width, height), "RGBA")
+        except (OSError, ValueError, struct.error) as e:
+            print_debug(f"Derived cache read failed {key}: {e}")
+            return None
+        # a surface de frombuffer mantém o mmap vivo enquanto existir
+        return surface
+
+    def save(self, key: str, surface: pygame.Surface):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                file.write(HEADER.pack(MAGIC, surface.get_width(), surface.get_height()))
+                file.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print_debug(f"Derived cache write failed {key}: {e}")
+
+    def clear(self):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".rgba"):
+                os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _path(self, key: str) -> AnyStr:
+        return os.path.join(self.directory, f"{key}.rgba")
+
+
+DERIVED = DerivedCache()
@@ -0,0 +1,52 @@
+from typing import Dict, Tuple, Iterable, AnyStr
+
+import pygame
+
+FontKey = Tuple[AnyStr, int, Tuple[bool, bool, bool]]
+
+
+class FontRegistry:
+    """
+    Cache de fontes do processo.
+    Cada combinação (path, size, style) é aberta e parseada uma única vez,
+    todos os chamadores recebem a mesma instância de pygame.font.Font.
+    """
+
+    def __init__(self):
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: AnyStr, size: int, bold: bool = False, italic: bool = False, underline: bool = False) -> pygame.font.Font:
+        key = (path, size, (bold, italic, underline))
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = pygame.font.Font(path, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        font.set_underline(underline)
+        self._fonts[key] = font
+        return font
+
+    def preload(self, path: AnyStr, sizes: Iterable[int]):
+        for size in sizes:
+            key = (path, size, (False, False, False))
+            if key not in self._fonts:
+                self._fonts[key] = pygame.font.Font(path, size)
+
+    def clear(self):
+        self._fonts.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "fonts": len(self._fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+FONTS = FontRegistry()
@@ -0,0 +1,213 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional, AnyStr, Any, TYPE_CHECKING
+
+import pygame
+
+from src.constants import ASSET_CACHE_MAX_BYTES
+from src.engine.assets.atlas import TextureAtlas
+from src.engine.assets.derived import DERIVED
+from src.utils import get_assets_path, print_debug
+
+if TYPE_CHECKING:
+    from src.engine.ui.ImageTransformStrategy import ImageTransformStrategy
+
+ImageKey = Tuple[AnyStr, Optional[Tuple[int, int]], bool, Any]
+
+
+class AssetManager:
+    """
+    Cache central de imagens e sons.
+    Cada arquivo é decodificado uma única vez e a surface resultante, já no formato
+    de pixel do display, é compartilhada entre todos os usuários.
+    Imagens presentes no atlas saem como subsurfaces da folha, sem abrir o arquivo solto.
+    Variantes escaladas/transformadas também passam pelo cache em disco de derivadas.
+    Imagens são descartadas por LRU quando o total passa de max_bytes.
+    As surfaces retornadas são compartilhadas: copie antes de desenhar sobre elas.
+    decode() e sound() podem ser chamados de threads de preload, o resto só da thread principal.
+    """
+
+    def __init__(self, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._images: "OrderedDict[ImageKey, pygame.Surface]" = OrderedDict()
+        self._unconverted: set = set()
+        self._sounds: Dict[AnyStr, pygame.mixer.Sound] = {}
+        self._decoded: Dict[ImageKey, pygame.Surface] = {}
+        self._lock = threading.Lock()
+        self.atlas = TextureAtlas()
+        self._image_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def image(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None, alpha: bool = True, transform: Optional["ImageTransformStrategy"] = None) -> pygame.Surface:
+        key = self._key(relative_path, size, alpha, transform)
+        surface = self._images.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            if key in self._unconverted and pygame.display.get_surface() is not None:
+                surface = self._replace(key, self._to_display_format(surface, alpha))
+            return surface
+
+        with self._lock:
+            surface = self._decoded.pop(key, None)
+        if surface is not None:
+            # já decodificada por uma thread de preload, falta só converter
+            self.hits += 1
+            return self._store(key, self._to_display_format(surface, alpha))
+
+        sprite = self.atlas.sprite(relative_path, size) if transform is None else None
+        if sprite is not None:
+            # a folha já está no formato do display, converter o sprite criaria uma cópia
+            self.misses += 1
+            return self._store(key, sprite)
+
+        self.misses += 1
+        surface = self._store(key, self._to_display_format(self._derive(key, transform), alpha))
+        with self._lock:
+            # uma thread de preload pode ter decodificado a mesma chave ao mesmo tempo; a cópia dela sobra
+            self._decoded.pop(key, None)
+        return surface
+
+    def decode(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None, alpha: bool = True, transform: Optional["ImageTransformStrategy"] = None):
+        key = self._key(relative_path, size, alpha, transform)
+        if key in self._images or key in self._decoded:
+            return
+        if transform is None and self.atlas.has(relative_path, size):
+            self.atlas.load_sheet(relative_path, size)
+            return
+        surface = self._derive(key, transform)
+        with self._lock:
+            # confere de novo: outra thread (ou a principal) pode ter chegado primeiro durante o decode
+            if key not in self._images and key not in self._decoded:
+                self._decoded[key] = surface
+
+    def is_ready(self, relative_path: AnyStr, size: Optional[Tuple[int, int]] = None, alpha: bool = True, transform: Optional["ImageTransformStrategy"] = None) -> bool:
+        key = self._key(relative_path, size, alpha, transform)
+        if transform is None and self.atlas.is_loaded(relative_path, size):
+            return True
+        return key in self._images or key in self._decoded
+
+    def sound(self, relative_path: AnyStr) -> pygame.mixer.Sound:
+        sound = self._sounds.get(relative_path)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        self.misses += 1
+        sound = pygame.mixer.Sound(os.path.join(get_assets_path(), relative_path))
+        with self._lock:
+            return self._sounds.setdefault(relative_path, sound)
+
+    def discard(self, relative_path: AnyStr):
+        for key in [key for key in self._images if key[0] == relative_path]:
+            self._remove(key)
+        self._sounds.pop(relative_path, None)
+
+    def clear(self):
+        with self._lock:
+            self._decoded.clear()
+        self._images.clear()
+        self._unconverted.clear()
+        self._sounds.clear()
+        self._image_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "images": len(self._images),
+            "sounds": len(self._sounds),
+            "decoded": len(self._decoded),
+            "image_bytes": self._image_bytes,
+            "atlas": self.atlas.stats(),
+            "sound_bytes": sum(self._sound_size(sound) for sound in self._sounds.values()),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def _key(relative_path: AnyStr, size: Optional[Tuple[int, int]], alpha: bool, transform: Optional["ImageTransformStrategy"]) -> ImageKey:
+        return relative_path, tuple(size) if size else None, alpha, transform.cache_key() if transform else None
+
+    @staticmethod
+    def _load(relative_path: AnyStr) -> pygame.Surface:
+        return pygame.image.load(os.path.join(get_assets_path(), relative_path))
+
+    def _derive(self, key: ImageKey, transform: Optional["ImageTransformStrategy"]) -> pygame.Surface:
+        relative_path, size, alpha, transform_key = key
+        if size is None and transform is None:
+            return self._load(relative_path)
+
+        def build() -> pygame.Surface:
+            # variantes derivadas não mantêm o original no cache, a não ser que ele já esteja lá
+            surface = self._images.get((relative_path, None, alpha, None))
+            if surface is None:
+                surface = self._load(relative_path)
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            if transform is not None:
+                surface = transform.transform(surface)
+            return surface
+
+        source_hash = DERIVED.file_hash(os.path.join(get_assets_path(), relative_path))
+        chain = ("scale", transform_key)
+        return DERIVED.get_or_create(DERIVED.key(source_hash, size, chain), build)
+
+    def _to_display_format(self, surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+        # Antes do set_mode não existe formato de display, convertemos no primeiro acesso depois dele
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def _store(self, key: ImageKey, surface: pygame.Surface) -> pygame.Surface:
+        if key in self._images:
+            # a mesma chave nunca é contada duas vezes no orçamento
+            self._remove(key)
+        self._images[key] = surface
+        self._image_bytes += self._surface_size(surface)
+        if pygame.display.get_surface() is None:
+            self._unconverted.add(key)
+        self._evict(keep=key)
+        return surface
+
+    def _replace(self, key: ImageKey, surface: pygame.Surface) -> pygame.Surface:
+        self._image_bytes -= self._surface_size(self._images[key])
+        self._unconverted.discard(key)
+        self._images[key] = surface
+        self._image_bytes += self._surface_size(surface)
+        return surface
+
+    def _remove(self, key: ImageKey):
+        surface = self._images.pop(key)
+        self._unconverted.discard(key)
+        self._image_bytes -= self._surface_size(surface)
+
+    def _evict(self, keep: ImageKey):
+        while self._image_bytes > self.max_bytes and len(self._images) > 1:
+            key = next(iter(self._images))
+            if key == keep:
+                break
+            self._remove(key)
+            self.evictions += 1
+            print_debug(f"Asset evicted: {key[0]} {key[1]}")
+
+    @staticmethod
+    def _surface_size(surface: pygame.Surface) -> int:
+        # subsurfaces do atlas dividem a memória da folha, contada em atlas.stats()
+        if surface.get_parent() is not None:
+            return 0
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def _sound_size(sound: pygame.mixer.Sound) -> int:
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return 0
+        frequency, size, channels = mixer
+        return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+
+ASSETS = AssetManager()
@@ -0,0 +1,90 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Tuple, Optional, AnyStr
+
+from src.constants import IMAGE_SIZE, PRELOAD_WORKERS
+from src.engine.assets.manager import ASSETS
+from src.engine.assets.sounds import TYPEWRITER
+from src.engine.ui.ImageTransformStrategy import ImageTransformStrategy, CircleMask
+from src.utils import get_assets_path, get_default_font_path, preload_default_fonts, print_debug
+
+# (caminho, tamanho, transformação): a mesma chave que a tela vai pedir ao ASSETS.image
+ImageEntry = Tuple[AnyStr, Optional[Tuple[int, int]], Optional[ImageTransformStrategy]]
+
+
+def _list_assets(folder: str, extension: str) -> List[AnyStr]:
+    path = os.path.join(get_assets_path(), folder)
+    if not os.path.isdir(path):
+        return []
+    return [os.path.join(folder, name) for name in sorted(os.listdir(path)) if name.endswith(extension)]
+
+
+def default_images() -> List[ImageEntry]:
+    return (
+        [(path, IMAGE_SIZE, None) for path in _list_assets("entities", ".png")]
+        + [(path, None, None) for path in _list_assets("items", ".png")]
+        # a imagem do ChatScene, já com a máscara circular do StaticImage
+        + [("chat.png", (400, 400), CircleMask(200))]
+    )
+
+
+def default_sounds() -> List[AnyStr]:
+    return _list_assets("sfx", ".mp3")
+
+
+def _read_file(path: AnyStr):
+    # só aquece o cache de disco, a fonte é parseada na thread principal em finish()
+    with open(path, "rb") as file:
+        file.read()
+
+
+class Preloader:
+    """
+    Decodifica imagens, sons e a fonte em threads de trabalho (o decode do pygame libera a GIL).
+    A thread principal só consulta progress() e chama finish(), que faz o que precisa do display.
+    """
+
+    def __init__(self, images: Optional[List[ImageEntry]] = None, sounds: Optional[List[AnyStr]] = None, workers: int = PRELOAD_WORKERS):
+        self.images = images if images is not None else default_images()
+        self.sounds = sounds if sounds is not None else default_sounds()
+        self.workers = workers
+        self.started_at: Optional[float] = None
+        self.finished = False
+        self._futures: List[Future] = []
+
+    def start(self):
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preload")
+        self.started_at = time.time()
+        self._futures = (
+            [executor.submit(_read_file, get_default_font_path())]
+            + [executor.submit(ASSETS.decode, path, size, transform=transform) for path, size, transform in self.images]
+            + [executor.submit(ASSETS.sound, path) for path in self.sounds]
+        )
+        executor.shutdown(wait=False)
+
+    def progress(self) -> float:
+        if not self._futures:
+            return 1.0
+        return sum(1 for future in self._futures if future.done()) / len(self._futures)
+
+    def done(self) -> bool:
+        return all(future.done() for future in self._futures)
+
+    def elapsed(self) -> float:
+        return time.time() - self.started_at if self.started_at else 0.0
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        preload_default_fonts()
+        TYPEWRITER.load()
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                print_debug(f"Preload failed: {future.exception()}")
+        # converte para o formato do display o que já foi decodificado, o resto é convertido sob demanda
+        for path, size, transform in self.images:
+            if ASSETS.is_ready(path, size, transform=transform):
+                ASSETS.image(path, size, transform=transform)
+        print_debug(f"Preload finished in {self.elapsed():.2f}s ({self.progress() * 100:.0f}%)")
@@ -0,0 +1,75 @@
+import random
+import time
+from typing import List, Optional, Dict, Any
+
+import numpy as np
+import pygame
+
+from src.constants import TYPEWRITER_VARIANTS, TYPEWRITER_MIN_INTERVAL
+
+TYPE_VOLUME = 0.4
+
+
+class TypewriterBank:
+    """
+    Banco de cliques de máquina de escrever sintetizados uma única vez.
+    Toca as variações em rodízio num canal reservado do mixer: um clique novo
+    interrompe o anterior (voice stealing) e cliques mais próximos que min_interval são descartados.
+    """
+
+    def __init__(self, variants: int = TYPEWRITER_VARIANTS, min_interval: float = TYPEWRITER_MIN_INTERVAL):
+        self.variants = variants
+        self.min_interval = min_interval
+        self._sounds: List[pygame.mixer.Sound] = []
+        self._channel: Optional[pygame.mixer.Channel] = None
+        self._next = 0
+        self._last_play = 0.0
+        self.played = 0
+        self.dropped = 0
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._sounds)
+
+    def load(self):
+        mixer = pygame.mixer.get_init()
+        if self.loaded or not mixer:
+            return
+        sample_rate, _, channels = mixer
+        rng = np.random.default_rng()
+        for _ in range(self.variants):
+            duration = random.uniform(0.01, 0.03)
+            samples = int(sample_rate * duration)
+
+            # ruído branco com envelope de ataque rápido
+            sound = rng.uniform(-1, 1, samples) * np.linspace(1, 0, samples)
+            sound = (sound * 32767 * TYPE_VOLUME).astype(np.int16)
+            self._sounds.append(pygame.sndarray.make_sound(np.column_stack([sound] * channels) if channels > 1 else sound))
+
+        # canal 0 fica fora da alocação automática, os cliques nunca disputam canal com o resto
+        pygame.mixer.set_reserved(1)
+        self._channel = pygame.mixer.Channel(0)
+
+    def play(self):
+        now = time.perf_counter()
+        if now - self._last_play < self.min_interval:
+            self.dropped += 1
+            return
+        if not self.loaded:
+            self.load()
+            if not self.loaded:
+                return
+        self._last_play = now
+        self._channel.play(self._sounds[self._next])
+        self._next = (self._next + 1) % len(self._sounds)
+        self.played += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "variants": len(self._sounds),
+            "played": self.played,
+            "dropped": self.dropped,
+        }
+
+
+TYPEWRITER = TypewriterBank()
@@ -0,0 +1,175 @@
+import csv
+import time
+from collections import deque
+from typing import Dict, List, Deque, Tuple, Optional, AnyStr
+
+import pygame
+
+from src.constants import DEBUG, PROFILER_HISTORY
+from src.utils import get_default_font, print_debug
+
+TOGGLE_KEY = pygame.K_F3
+DUMP_KEY = pygame.K_F4
+HISTOGRAM_BUCKET_MS = 2
+HISTOGRAM_BUCKETS = 25
+TOP_SECTIONS = 8
+INFO_LINES = 3
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """
+    Mede o tempo de cada frame e de seções nomeadas dentro dele (cena, elementos, combate, tokens do chat).
+    Desligado, measure() devolve um contexto vazio e o custo é só uma chamada.
+    Guarda os últimos history frames para o overlay (FPS, percentis, histograma) e para o CSV.
+    """
+
+    def __init__(self, enabled: bool = DEBUG, history: int = PROFILER_HISTORY):
+        self.enabled = enabled
+        self.frames: Deque[Tuple[int, float, Dict[str, float]]] = deque(maxlen=history)
+        self.frame_index = 0
+        self._sections: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        # linhas extras do overlay publicadas por outros módulos (ex.: telemetria do chat)
+        self.info: Dict[str, List[str]] = {}
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self._frame_start = None
+
+    def measure(self, name: str):
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def set_info(self, key: str, lines: List[str]):
+        self.info[key] = lines
+
+    def add(self, name: str, seconds: float):
+        self._sections[name] = self._sections.get(name, 0.0) + seconds
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        # o tempo de frame vai de um begin_frame ao próximo, incluindo a espera do clock
+        if self._frame_start is not None:
+            self.frames.append((self.frame_index, now - self._frame_start, self._sections))
+            self.frame_index += 1
+        self._frame_start = now
+        self._sections = {}
+
+    def frame_times(self) -> List[float]:
+        return [frame_time for _, frame_time, _ in self.frames]
+
+    def fps(self) -> float:
+        times = self.frame_times()
+        return len(times) / sum(times) if times and sum(times) > 0 else 0.0
+
+    def percentile(self, p: float) -> float:
+        times = sorted(self.frame_times())
+        if not times:
+            return 0.0
+        return times[min(len(times) - 1, int(len(times) * p / 100))]
+
+    def histogram(self) -> List[int]:
+        buckets = [0] * HISTOGRAM_BUCKETS
+        for frame_time in self.frame_times():
+            buckets[min(HISTOGRAM_BUCKETS - 1, int(frame_time * 1000 // HISTOGRAM_BUCKET_MS))] += 1
+        return buckets
+
+    def top_sections(self, count: int = TOP_SECTIONS) -> List[Tuple[str, float]]:
+        totals: Dict[str, float] = {}
+        for _, _, sections in self.frames:
+            for name, seconds in sections.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        frames = max(1, len(self.frames))
+        return sorted(((name, total / frames) for name, total in totals.items()), key=lambda item: item[1], reverse=True)[:count]
+
+    def dump_csv(self, path: Optional[AnyStr] = None) -> AnyStr:
+        # formato longo: uma linha por seção de cada frame
+        path = path or time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "frame_ms", "section", "section_ms"])
+            for index, frame_time, sections in self.frames:
+                writer.writerow([index, f"{frame_time * 1000:.3f}", "", ""])
+                for name, seconds in sections.items():
+                    writer.writerow([index, f"{frame_time * 1000:.3f}", name, f"{seconds * 1000:.3f}"])
+        print_debug(f"Profile of {len(self.frames)} frames written to {path}")
+        return path
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        # devolve True quando o evento era do profiler
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == TOGGLE_KEY:
+            self.toggle()
+            return True
+        if event.key == DUMP_KEY and self.enabled:
+            self.dump_csv()
+            return True
+        return False
+
+    def render(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        if not self.enabled:
+            return None
+        font = get_default_font(12)
+        line_height = font.get_linesize()
+        lines = [
+            f"FPS {self.fps():.1f}",
+            f"frame p50 {self.percentile(50) * 1000:.2f} ms  p95 {self.percentile(95) * 1000:.2f} ms  p99 {self.percentile(99) * 1000:.2f} ms",
+        ] + [f"{seconds * 1000:7.3f} ms  {name}" for name, seconds in self.top_sections()]
+        # painel opaco e de tamanho fixo: no modo dirty rects a cena não redesenha o que fica embaixo
+        lines += [""] * (2 + TOP_SECTIONS - len(lines))
+        info = [line for key in sorted(self.info) for line in self.info[key]][:INFO_LINES]
+        lines += info + [""] * (INFO_LINES - len(info))
+
+        histogram = self.histogram()
+        histogram_height = 40
+        width = 520
+        panel = pygame.Surface((width, line_height * len(lines) + histogram_height + 12))
+        for i, line in enumerate(lines):
+            if line:
+                panel.blit(font.render(line, True, (0, 255, 0)), (6, 4 + i * line_height))
+
+        # histograma dos tempos de frame, baldes de HISTOGRAM_BUCKET_MS
+        top = 8 + len(lines) * line_height
+        bar_width = (width - 12) // HISTOGRAM_BUCKETS
+        peak = max(histogram) or 1
+        for i, count in enumerate(histogram):
+            height = int(histogram_height * count / peak)
+            within_budget = i * HISTOGRAM_BUCKET_MS < 1000 / 60
+            pygame.draw.rect(panel, (0, 255, 0) if within_budget else (255, 80, 0), (6 + i * bar_width, top + histogram_height - height, bar_width - 1, height))
+
+        return surface.blit(panel, (surface.get_width() - width - 8, 8))
+
+
+PROFILER = FrameProfiler()
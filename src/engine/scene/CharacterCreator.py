@@ -141,7 +141,7 @@ class CharacterCreator(Scene):
     def build_scene(self, game: "Game") -> List[SceneElement]:
 
         return [
-            SimpleText("Character Creator", 48, (get_center_x(self.screen, get_default_font(48).size("Character Creator")[0]), 0)),
+            SimpleText("Character Creator", 48, (get_center_x(self.screen, get_default_font(48).size("Character Creator")[0]), 0)).as_static(),
             RadioButtonGroup(label_str="Select Race",position=(12,90),on_change=self._set_selected_race,options=[(race.value,race) for race in CharacterRace]),
             RadioButtonGroup(label_str="Select Class",position=(12,self.screen.get_height()//2),on_change=self._set_selected_class,options=[(clazz.value,clazz) for clazz in CharacterClassEnum]),
             RadioButtonGroup(
@@ -1,9 +1,12 @@
 import queue
 import time
-from typing import List, Callable, Dict
+from typing import List, Callable, Dict, Tuple, Optional
 
 import pygame
 
+from src.constants import TOKEN_DRAIN_BUDGET
+from src.engine.ai.turn import EndOfStream, Turn
+from src.engine.profiler import PROFILER
 from src.engine.scene.CombatScene import CombatScene
 from src.engine.scene.Scene import Scene
 from src.engine.scene.SceneElement import SceneElement
@@ -19,6 +22,8 @@ from src.utils import get_center_x, print_debug, get_default_font, typewriter_so
 
 
 class ChatScene(Scene):
+    dirty_rects = True
+
     def __init__(self,screen,game,scenario: Scenario):
 
         self.scenario = scenario
@@ -63,6 +68,11 @@ class ChatScene(Scene):
         super().__init__(None, screen, game)
 
         self.loading = False
+        self.cancelled = False
+        # turno desta cena cujo fim (EndOfStream) libera a entrada
+        self.turn: Optional[Turn] = None
+        # eventos do jogo (fim de combate) que chegaram com um turno em andamento
+        self.pending_events: List[str] = []
 
         self.commands: Dict[str,Callable[[List[str]],None]] = {
             "get_player_status": self._get_player_attribute,
@@ -91,7 +101,7 @@ class ChatScene(Scene):
                 size=(400,400),
                 position=(get_center_x(self.screen,400),0),
                 circle_radius=200
-            ),
+            ).as_static(),
 
 
         ] + [self.submit_button,self.player_input,self.actual_text,self.combat_button]
@@ -129,7 +139,7 @@ class ChatScene(Scene):
 
     def _put_text(self,text):
         current_time = time.time()
-        self.actual_text.text = self.actual_text.text + text
+        self.actual_text.append_text(text)
 
         if current_time - self.last_sound_time > self.sound_cooldown:
             typewriter_sound()
@@ -148,28 +158,78 @@ class ChatScene(Scene):
 
         else:
             self._put_text(f"\n{self.game.player.name}:\n{text}\nDM:\n")
-            self._hide_input()
-            self.loading = True
-            self.game.chat.submit(text)
-            self._put_text("\n")
-            self.loading = False
-            self._show_input()
+            if not self._start_turn(text):
+                self._put_text("\nSystem:\nAguarde o fim da resposta atual.\n")
+
+    def _start_turn(self, text) -> bool:
+        # a entrada fica bloqueada até o EndOfStream deste turno chegar pela fila
+        turn = self.game.chat.submit(text)
+        if turn is None:
+            return False
+        self.turn = turn
+        self.loading = True
+        self.cancelled = False
+        self._hide_input()
+        return True
 
-    def update(self):
-        super().update()
+    def _end_turn(self):
+        self.loading = False
+        # os tokens que já estavam na fila aparecem antes do aviso
+        self._put_text("\n*[cancelado]*\n" if self.cancelled else "\n")
+        self.cancelled = False
+        self._show_input()
+        self._start_pending_event()
 
-        if not self.game.chat.is_generating():
-            return
+    def _start_pending_event(self):
+        # o DM recebe o evento assim que o turno em andamento termina
+        if self.pending_events and self._start_turn(self.pending_events[0]):
+            self.pending_events.pop(0)
 
-        try:
-            token = self.game.chat.token_queue.get_nowait()
-        except queue.Empty:
+    def handle_event(self, event):
+        # Ctrl+C interrompe a resposta em andamento (Esc já fecha o jogo)
+        if self.loading and event.type == pygame.KEYDOWN and event.key == pygame.K_c and event.mod & pygame.KMOD_CTRL:
+            self.cancelled = self.game.chat.cancel() or self.cancelled
             return
+        super().handle_event(event)
+
+    def update(self):
+        super().update()
+
+        if not self.loading and self.pending_events:
+            self._start_pending_event()
 
-        if token is None:
+        if not self.loading and not self.game.chat.is_generating():
             return
 
-        self._put_text(token)
+        with PROFILER.measure("ChatScene.tokens"):
+            text, finished = self._drain_tokens()
+            if text:
+                self._put_text(text)
+            if finished:
+                self._end_turn()
+
+    def _drain_tokens(self, budget: float = TOKEN_DRAIN_BUDGET) -> Tuple[str, bool]:
+        # pega tudo o que já chegou, dentro do orçamento do frame, e junta num único append:
+        # a velocidade do texto deixa de depender do FPS
+        token_queue = self.game.chat.token_queue
+        deadline = time.perf_counter() + budget
+        tokens = []
+        while time.perf_counter() < deadline:
+            try:
+                token = token_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(token, EndOfStream):
+                if token.turn is self.turn:
+                    return "".join(tokens), True
+                # fim de um turno anterior, que ficou na fila durante o combate: o texto dele já entrou
+                tokens.append("\n")
+                continue
+            tokens.append(token)
+        return "".join(tokens), False
+
+    def is_animating(self) -> bool:
+        return self.loading or self.game.chat.is_generating() or super().is_animating()
 
     def _on_change(self,text):
         self.player_input.text.text = text
@@ -177,7 +237,9 @@ class ChatScene(Scene):
     def end_combat(self):
         self.combat_button.visible = False
         self.combat_button.enabled = False
-        self.game.chat.submit(f"event:combat_ended\nVictory:{str(self.eminent_combat.result.victory)}\nPlayer Fled:{str(self.eminent_combat.result.player_flee)}\nEnemies Flee: {len(self.eminent_combat.result.enemies_flee)}\nPlayer Kills: {self.eminent_combat.result.kills}\nTotal Enemies: {len(self.eminent_combat.result.enemies)}")
+        event = f"event:combat_ended\nVictory:{str(self.eminent_combat.result.victory)}\nPlayer Fled:{str(self.eminent_combat.result.player_flee)}\nEnemies Flee: {len(self.eminent_combat.result.enemies_flee)}\nPlayer Kills: {self.eminent_combat.result.kills}\nTotal Enemies: {len(self.eminent_combat.result.enemies)}"
         self.eminent_combat = None
-        self._show_input()
+        if not self._start_turn(event):
+            # o turno que abriu o combate ainda não acabou: o resultado vai logo depois dele
+            self.pending_events.append(event)
 
@@ -3,6 +3,7 @@ from typing import List, Optional, TYPE_CHECKING
 import pygame
 
 from src.constants import IMAGE_SIZE
+from src.engine.profiler import PROFILER
 from src.engine.scene.Scene import Scene
 from src.engine.scene.SceneElement import SceneElement
 from src.engine.ui.Bar import Bar
@@ -110,13 +111,19 @@ class CombatScene(Scene):
 
     def update(self):
         super().update()
-        self.combat.update()
+        with PROFILER.measure("Combat.update"):
+            self.combat.update()
         self._update_action_buttons()
         self._update_log_text()
         self._update_life_bar()
         self._update_target()
 
 
+    def is_animating(self) -> bool:
+        # ações com atraso na fila e turnos dos inimigos andam sem input do jogador
+        combat = self.combat
+        return combat.current_action is not None or bool(combat.action_queue) or not combat.is_player_turn or super().is_animating()
+
     def handle_event(self, event):
         super().handle_event(event)
         if event and event.type == pygame.KEYDOWN and event.key == pygame.K_END:
@@ -126,7 +133,7 @@ class CombatScene(Scene):
     def build_scene(self, game: "Game") -> List[SceneElement]:
         return [
             SimpleText("Combat!", 48,
-                       (get_center_x(self.screen, get_default_font(48).size("Combat!")[0]), 0)),
+                       (get_center_x(self.screen, get_default_font(48).size("Combat!")[0]), 0)).as_static(),
             self.life_bar,
             self.rg_skill_select,
             self.rg_item_select,
@@ -0,0 +1,154 @@
+from typing import List, Dict, Tuple, Optional, Set, Any
+
+import pygame
+
+from src.constants import HIT_GRID_CELL
+from src.engine.scene.SceneElement import SceneElement
+
+POINTER_EVENTS = {pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL}
+KEY_EVENTS = {pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING}
+
+
+class SpatialGrid:
+    """
+    Grade uniforme sobre os retângulos dos elementos: cada célula guarda os índices
+    dos elementos que a tocam, então achar o que está sob o mouse não depende do total de elementos.
+    """
+
+    def __init__(self, cell_size: int = HIT_GRID_CELL):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def build(self, rects: List[Optional[pygame.Rect]]):
+        self._cells = {}
+        size = self.cell_size
+        for i, rect in enumerate(rects):
+            if rect is None or not rect.width or not rect.height:
+                continue
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    self._cells.setdefault((cx, cy), []).append(i)
+
+    def query(self, point: Tuple[int, int]) -> List[int]:
+        return self._cells.get((point[0] // self.cell_size, point[1] // self.cell_size), [])
+
+
+class EventRouter:
+    """
+    Entrega cada evento só aos elementos que podem reagir a ele:
+    eventos de mouse aos elementos sob o cursor (pela SpatialGrid), mais os que estavam com hover ou foco;
+    teclado e texto ao elemento focado; o resto a quem assinou o tipo em event_types.
+    Elementos com event_types = None recebem tudo, como antes.
+    """
+
+    def __init__(self, cell_size: int = HIT_GRID_CELL):
+        self.grid = SpatialGrid(cell_size)
+        self._elements: List[SceneElement] = []
+        self._order: Dict[int, int] = {}
+        self._subscribers: Dict[int, List[SceneElement]] = {}
+        self._broadcast: List[SceneElement] = []
+        self._pointer: List[SceneElement] = []
+        self._unbounded: List[SceneElement] = []
+        self._bounds: List[Optional[pygame.Rect]] = []
+        self._epoch = -1
+        self._hovered: List[SceneElement] = []
+        self.focus_chain: List[SceneElement] = []
+        self.frame_elements: List[SceneElement] = []
+        self.dispatched = 0
+
+    def sync(self, elements: List[SceneElement]):
+        # comparação de listas por identidade, barata mesmo com centenas de elementos
+        if elements == self._elements:
+            return
+        self._elements = list(elements)
+        self._order = {id(element): i for i, element in enumerate(self._elements)}
+        self._subscribers = {}
+        self._broadcast = []
+        for element in self._elements:
+            if element.event_types is None:
+                self._broadcast.append(element)
+                continue
+            for event_type in element.event_types:
+                self._subscribers.setdefault(event_type, []).append(element)
+        self._pointer = [element for element in self._elements if element.event_types is not None and element.event_types & POINTER_EVENTS]
+        self.focus_chain = [element for element in self._elements if element.focusable]
+        self.frame_elements = [element for element in self._elements if element.frame_update]
+        self._hovered = [element for element in self._hovered if id(element) in self._order]
+        self._epoch = -1
+
+    def sync_bounds(self, epoch: int):
+        # a grade só é refeita quando a lista de elementos ou a geometria de algum deles muda (relayout)
+        if epoch == self._epoch:
+            return
+        self._epoch = epoch
+        bounds = [element.bounds() for element in self._pointer]
+        self._bounds = bounds
+        self._unbounded = [element for element, rect in zip(self._pointer, bounds) if rect is None]
+        self.grid.build(bounds)
+
+    def targets(self, event: pygame.event.Event, mouse_position: Tuple[int, int]) -> List[SceneElement]:
+        if event.type in POINTER_EVENTS:
+            hit = self._hit(mouse_position)
+            candidates = hit + self._hovered
+            if event.type == pygame.MOUSEMOTION:
+                # quem estava sob o cursor recebe o movimento seguinte para poder sair do hover
+                self._hovered = hit
+            else:
+                self._hovered = list(dict.fromkeys(candidates))
+                candidates += self.focused()
+        elif event.type in KEY_EVENTS:
+            candidates = self.focused() + [element for element in self._subscribers.get(event.type, []) if not element.focusable]
+        else:
+            candidates = list(self._subscribers.get(event.type, []))
+
+        selected: Set[int] = set()
+        result = []
+        for element in candidates + self._broadcast:
+            if id(element) in selected:
+                continue
+            if element.event_types is not None and event.type not in element.event_types:
+                continue
+            selected.add(id(element))
+            result.append(element)
+        # mantém a ordem da cena, como no laço original
+        result.sort(key=lambda element: self._order.get(id(element), 0))
+        self.dispatched += len(result)
+        return result
+
+    def hover(self, mouse_position: Tuple[int, int]) -> List[SceneElement]:
+        # como um MOUSEMOTION parado: quem está sob o cursor passa a receber o próximo movimento;
+        # devolve, na ordem da cena, quem está sob o cursor mais quem estava antes (para sair do hover)
+        previous = self._hovered
+        self._hovered = self._hit(mouse_position)
+        result = list(dict.fromkeys(self._hovered + previous))
+        result.sort(key=lambda element: self._order.get(id(element), 0))
+        return result
+
+    def _hit(self, mouse_position: Tuple[int, int]) -> List[SceneElement]:
+        hit = [self._pointer[i] for i in self.grid.query(mouse_position) if self._bounds[i].collidepoint(mouse_position)]
+        return hit + self._unbounded
+
+    def index_of(self, element: SceneElement) -> int:
+        return self._order.get(id(element), -1)
+
+    def focused(self) -> List[SceneElement]:
+        return [element for element in self.focus_chain if element.has_focus()]
+
+    def focus_next(self, step: int = 1):
+        chain = [element for element in self.focus_chain if element.visible]
+        if not chain:
+            return
+        focused = [element for element in chain if element.has_focus()]
+        index = chain.index(focused[0]) + step if focused else 0
+        for element in focused:
+            element.set_focus(False)
+        chain[index % len(chain)].set_focus(True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "elements": len(self._elements),
+            "pointer": len(self._pointer),
+            "broadcast": len(self._broadcast),
+            "cells": len(self.grid._cells),
+            "dispatched": self.dispatched,
+        }
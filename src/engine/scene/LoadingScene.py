@@ -0,0 +1,49 @@
+from typing import List, Callable, TYPE_CHECKING
+
+import pygame
+
+from src.constants import PRELOAD_BUDGET
+from src.engine.assets.preload import Preloader
+from src.engine.scene.Scene import Scene
+from src.engine.scene.SceneElement import SceneElement
+from src.engine.ui.Bar import Bar
+from src.engine.ui.SimpleText import SimpleText
+from src.utils import get_center_x, get_default_font
+
+if TYPE_CHECKING:
+    from src.engine.Game import Game
+
+
+class LoadingScene(Scene):
+    dirty_rects = True
+
+    def __init__(self, screen: pygame.Surface, game: "Game", on_done: Callable[[], None], preloader: Preloader = None):
+        self.preloader = preloader if preloader is not None else Preloader()
+        self.on_done = on_done
+        self.progress_bar = Bar(
+            position=(get_center_x(screen, 300), screen.get_height() // 2),
+            width=300,
+            initial_progress=0,
+            max_progress=100
+        )
+        super().__init__(None, screen, game)
+        self.preloader.start()
+
+    def build_scene(self, game: "Game") -> List[SceneElement]:
+        return [
+            SimpleText("G.R.A.S.S", 48, (get_center_x(self.screen, get_default_font(48).size("G.R.A.S.S")[0]), 0)).as_static(),
+            self.progress_bar
+        ]
+
+    def is_animating(self) -> bool:
+        return True
+
+    def update(self):
+        super().update()
+        self.progress_bar.change_label(f"Loading... {int(self.preloader.progress() * 100)}%", True)
+        self.progress_bar.progress = int(self.preloader.progress() * 100)
+
+        # passado o orçamento o menu é liberado mesmo com o preload incompleto
+        if self.preloader.done() or self.preloader.elapsed() > PRELOAD_BUDGET:
+            self.preloader.finish()
+            self.on_done()
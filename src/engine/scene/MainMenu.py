@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from src.engine.Game import Game
 
 class MainMenu(Scene):
+    dirty_rects = True
 
     def __init__(self,background: Optional[pygame.Surface],screen: pygame.Surface,game: "Game"):
         super().__init__(background,screen,game)
@@ -26,7 +27,7 @@ class MainMenu(Scene):
 
     def build_scene(self, game: "Game") -> List[SceneElement]:
         return [
-            SimpleText("G.R.A.S.S",48,(get_center_x(self.screen,get_default_font(48).size("G.R.A.S.S")[0]),0)),
+            SimpleText("G.R.A.S.S",48,(get_center_x(self.screen,get_default_font(48).size("G.R.A.S.S")[0]),0)).as_static(),
             Button(
                 image=None,
                 position=(get_center_x(self.screen,get_default_font(30).size("New Game!")[0]),90),
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from src.engine.Game import Game
 
 class Options(Scene):
+    dirty_rects = True
 
     def __init__(self, background: Optional[pygame.Surface],screen: pygame.Surface,game: "Game"):
         self.api_key = game.options["api_key"]
@@ -41,11 +42,12 @@ class Options(Scene):
             self.game.options["api_key"] = self.api_key
         self.game.options["gpt_model"] = self.gpt_model
         self.game.save_options()
-        self.game.running = False
+        self.game.reload_chat()
+        self.game.main_menu()
 
     def build_scene(self, game: object) -> List[SceneElement]:
         return [
-            SimpleText("Options",48,(get_center_x(self.screen,get_default_font(48).size("Options")[0]),0)),
+            SimpleText("Options",48,(get_center_x(self.screen,get_default_font(48).size("Options")[0]),0)).as_static(),
             Button(
                 image=None,
                 position=(get_center_x(self.screen,get_default_font(30).size("Colar")[0]),90),
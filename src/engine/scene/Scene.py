@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, Any
 
 import pygame
 from typing import TYPE_CHECKING
 
 
+from src.engine.scene.EventRouter import EventRouter
 from src.engine.scene.SceneElement import SceneElement
+from src.engine.profiler import PROFILER
 
 
 if TYPE_CHECKING:
@@ -13,36 +15,148 @@ if TYPE_CHECKING:
 
 
 class Scene(ABC):
+    # opt-in: só redesenha as regiões que mudaram e o Game atualiza só esses retângulos
+    dirty_rects = False
+
     def __init__(self,background: Optional[pygame.Surface],screen: pygame.Surface,game: "Game"):
         self.game = game
         self.background = background
         self.screen = screen
+        self.router = EventRouter()
         self.elements :List[SceneElement] = self.build_scene(self.game)
+        self._frame_states: Optional[List[Tuple[SceneElement, Any, Optional[pygame.Rect]]]] = None
+        # camada estática: fundo + elementos static compostos uma vez numa surface fora da tela
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_key: Optional[Tuple[Any, ...]] = None
 
 
-    def render(self):
-        #render background
-        if self.background is not None:
-            self.screen.blit(self.background, (0, 0))
+    def render(self) -> Optional[List[pygame.Rect]]:
+        # retorna os retângulos alterados, ou None quando a tela inteira foi redesenhada
+        if not self.dirty_rects:
+            self._render_full()
+            return None
+        return self._render_dirty()
+
+    def _measure(self, element: SceneElement, phase: str):
+        # o nome só é montado com o profiler ligado
+        if not PROFILER.enabled:
+            return PROFILER.measure(phase)
+        return PROFILER.measure(f"{type(self).__name__}/{type(element).__name__}#{self.router.index_of(element)}.{phase}")
+
+    def is_animating(self) -> bool:
+        return any(element.is_animating() for element in self.elements)
+
+    def invalidate(self):
+        # força um redesenho completo no próximo frame
+        self._frame_states = None
+        self.refresh_hover()
+
+    def refresh_hover(self):
+        # o hover só muda com MOUSEMOTION: ao ativar a cena, quem já está sob o cursor
+        # precisa de um update com a posição atual para não esperar o mouse se mexer
+        self.router.sync(self.elements)
+        self.router.sync_bounds(SceneElement.layout_epoch)
+        mouse_position = pygame.mouse.get_pos()
+        for element in self.router.hover(mouse_position):
+            # os de frame_update já receberam o update deste frame
+            if not element.frame_update:
+                element.update(None, mouse_position)
+
+    def invalidate_static(self):
+        self._static_key = None
+
+    def _update_static_layer(self) -> bool:
+        # recompõe quando a tela muda de tamanho, o fundo muda ou os elementos estáticos mudam
+        static = [element for element in self.elements if element.static]
+        key = (self.screen.get_size(), self.background, tuple((element, element.render_state()) for element in static))
+        if key == self._static_key:
+            return False
+        self._static_key = key
+        # a camada antiga sai antes de compor, senão _draw_background copiaria os pixels dela
+        self._static_layer = None
+        if not static:
+            return True
+        layer = pygame.Surface(self.screen.get_size())
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        self._draw_background(layer, None)
+        for element in static:
+            element.render(layer)
+        self._static_layer = layer
+        return True
+
+    def _draw_background(self, surface: pygame.Surface, rect: Optional[pygame.Rect]):
+        if self._static_layer is not None and surface is not self._static_layer:
+            surface.blit(self._static_layer, rect or (0, 0), rect)
+        elif self.background is not None:
+            surface.blit(self.background, rect or (0, 0), rect)
         else:
-            self.screen.fill((0,0,0))
+            surface.fill((0,0,0), rect)
+
+    def _render_full(self):
+        #render background
+        self._update_static_layer()
+        self._draw_background(self.screen, None)
 
         #rende elements
         for element in self.elements:
-            element.render(self.screen)
+            if not element.static:
+                with self._measure(element, "render"):
+                    element.render(self.screen)
+
+    def _render_dirty(self) -> List[pygame.Rect]:
+        states = [(element, element.render_state(), element.bounds()) for element in self.elements if not element.static]
+        previous = self._frame_states
+        self._frame_states = states
+        if (
+            self._update_static_layer()
+            or previous is None
+            or [element for element, _, _ in previous] != [element for element, _, _ in states]
+            or any(bounds is None for _, _, bounds in states)
+        ):
+            self._render_full()
+            for element in self.elements:
+                element.dirty = False
+            return [self.screen.get_rect()]
+
+        dirty: List[pygame.Rect] = []
+        for (element, old_state, old_bounds), (_, state, bounds) in zip(previous, states):
+            if element.dirty or old_state != state or old_bounds != bounds:
+                dirty.extend([old_bounds.union(bounds)] if old_bounds.colliderect(bounds) else [old_bounds, bounds])
+            element.dirty = False
+        dirty = [rect.clip(self.screen.get_rect()) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self._draw_background(self.screen, rect)
+            for element, _, bounds in states:
+                if bounds.colliderect(rect):
+                    with self._measure(element, "render"):
+                        element.render(self.screen)
+        self.screen.set_clip(None)
+        return dirty
 
     @abstractmethod
     def build_scene(self, game: "Game") -> List[SceneElement]:
         pass
 
     def handle_event(self, event):
+        self.router.sync(self.elements)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB and self.router.focus_chain:
+            self.router.focus_next(-1 if event.mod & pygame.KMOD_SHIFT else 1)
+            return
         mouse_position = pygame.mouse.get_pos()
-        for element in self.elements:
-            element.update(event, mouse_position)
+        self.router.sync_bounds(SceneElement.layout_epoch)
+        for element in self.router.targets(event, mouse_position):
+            with self._measure(element, "handle_event"):
+                element.update(event, mouse_position)
 
 
     def update(self):
+        self.router.sync(self.elements)
         mouse_position = pygame.mouse.get_pos()
-        for element in self.elements:
-            element.update(None, mouse_position)
+        for element in self.router.frame_elements:
+            with self._measure(element, "update"):
+                element.update(None, mouse_position)
 
@@ -1,12 +1,53 @@
 from abc import abstractmethod, ABC
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Any, FrozenSet
 
 import pygame
 
 
 class SceneElement(ABC):
+    # tipos de evento que o elemento trata (None = todos); o EventRouter da cena só entrega esses
+    event_types: Optional[FrozenSet[int]] = None
+    # se precisa de update(None, ...) a cada frame
+    frame_update = True
+    focusable = False
+    # incrementado quando a geometria de algum elemento muda; o EventRouter refaz a grade quando ele muda
+    layout_epoch = 0
+
     def __init__(self):
         self.visible = True
+        self.dirty = True
+        # elementos estáticos são compostos uma vez na camada estática da cena
+        self.static = False
+
+    def as_static(self) -> "SceneElement":
+        self.static = True
+        return self
+
+    def mark_dirty(self):
+        # para mudanças que render_state não enxerga
+        self.dirty = True
+
+    def relayout(self):
+        # chamar depois de mover ou redimensionar um elemento que recebe eventos de mouse
+        SceneElement.layout_epoch += 1
+
+    def has_focus(self) -> bool:
+        return False
+
+    def set_focus(self, focused: bool):
+        pass
+
+    def is_animating(self) -> bool:
+        # enquanto True o Game roda em taxa cheia em vez de esperar por eventos
+        return False
+
+    def bounds(self) -> Optional[pygame.Rect]:
+        # área da tela onde o elemento desenha; None = desconhecida, a cena redesenha tudo
+        return None
+
+    def render_state(self) -> Any:
+        # retrato barato do que afeta o desenho, comparado entre frames no modo dirty rects
+        return self.visible
 
     @abstractmethod
     def render(self, screen: pygame.Surface):
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Tuple, Optional, Any
 
 import pygame
 
@@ -8,6 +8,9 @@ from src.utils import get_default_font, get_center_x
 
 
 class Bar(UIElement):
+    event_types = frozenset()
+    frame_update = False
+
     def update(self, event: pygame.event.Event, mouse_position: Tuple[int, int]):
         pass
 
@@ -20,6 +23,7 @@ class Bar(UIElement):
         self.bar_color = bar_color
         self.rect = pygame.Rect(position[0],position[1],width,height)
         self.label = None
+        self.label_top = label_top
         if label_str:
             self.label = SimpleText(
                 text=label_str,
@@ -29,6 +33,13 @@ class Bar(UIElement):
             )
 
 
+    def bounds(self) -> Optional[pygame.Rect]:
+        bar_rect = pygame.Rect(self.position[0], self.position[1], max(self.width, self.progress / self.max_progress * self.width), self.height)
+        return bar_rect.unionall([self.rect] + ([self.label.bounds()] if self.label is not None else []))
+
+    def render_state(self) -> Any:
+        return self.progress, self.max_progress, tuple(self.position), self.label.render_state() if self.label else None
+
     def render(self, surface: pygame.Surface):
         percent = self.progress / self.max_progress
         bar_width = percent * self.width
@@ -41,9 +52,13 @@ class Bar(UIElement):
 
     def change_label(self,label_str:str,label_top:bool):
         if self.label is not None:
+            if self.label.text == label_str and self.label_top == label_top:
+                return self.label
+            self.label_top = label_top
             self.label.change_text(label_str)
             self.label.position = self._calculate_label_position(label_top, label_str)
         else:
+            self.label_top = label_top
             self.label = SimpleText(
                 text=label_str,
                 position=self._calculate_label_position(label_top, label_str),
@@ -1,15 +1,22 @@
 import os.path
-from typing import Tuple, Callable, Optional
+from typing import Tuple, Callable, Optional, Dict, Any
+from weakref import WeakKeyDictionary
 
 import pygame
 
-from src.engine.ui.ImageTransformStrategy import ImageTransformStrategy
+from src.engine.assets.manager import ASSETS
+from src.engine.ui.ImageTransformStrategy import ImageTransformStrategy, memoized
 from src.engine.ui.SimpleText import SimpleText
 from src.engine.ui.UIElement import UIElement
-from src.utils import get_assets_path
 
 
 class Button(UIElement):
+    # botões com o mesmo texto, fundo e padding dividem a imagem base e, com ela, os estados de hover/click
+    _composed: "WeakKeyDictionary[pygame.Surface, Dict[Tuple[Any, ...], pygame.Surface]]" = WeakKeyDictionary()
+    # o hover é recalculado a cada movimento do mouse, não precisa de update por frame
+    event_types = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN})
+    frame_update = False
+
     def __init__(self, image: Optional[pygame.Surface], position: Tuple[int, int],text: Optional[SimpleText] = None,hover_function: Optional[Callable] = None,click_function: Optional[Callable] = None,hover_transform_strategy: Optional[ImageTransformStrategy] = None,click_transform_strategy: Optional[ImageTransformStrategy] = None,background_color: Optional[Tuple[int, int, int]] = None,padding = (24,12) ,hover_sound="button_hover.mp3",click_sound="button_click.mp3"):
         super().__init__(None, position)
         self.background_color = background_color
@@ -17,37 +24,29 @@ class Button(UIElement):
         self.text = text
         self.clean_image = image
         self.image = self.get_image(text,image,background_color,padding)
-        self.rect = self.image.get_rect()
+        self.rect = self.image.get_rect(topleft=self.position)
         self.hover_function = hover_function
         self.click_function = click_function
         self.hover_transform_strategy = hover_transform_strategy
         self.click_transform_strategy = click_transform_strategy
-        if click_sound is not None:
-            self.click_sound = pygame.mixer.Sound(os.path.join(get_assets_path(),"sfx",click_sound))
-        if hover_sound is not None:
-            self.hover_sound = pygame.mixer.Sound(os.path.join(get_assets_path(),"sfx",hover_sound))
-        self.original_image = self.image.copy()
-        self.hover_image = (
-            hover_transform_strategy.transform(self.original_image)
-            if hover_transform_strategy else self.original_image
-        )
-        self.click_image = (
-            click_transform_strategy.transform(self.original_image)
-            if click_transform_strategy else self.original_image
-        )
+        self.click_sound = ASSETS.sound(os.path.join("sfx",click_sound)) if click_sound is not None else None
+        self.hover_sound = ASSETS.sound(os.path.join("sfx",hover_sound)) if hover_sound is not None else None
+        self.original_image = self.image
+        self.hover_image = self._transform(hover_transform_strategy)
+        self.click_image = self._transform(click_transform_strategy)
 
     def update_image(self):
         self.image = self.get_image(self.text, self.clean_image, self.background_color, self.padding)
-        self.original_image = self.image.copy()
-        self.rect = self.image.get_rect()
-        self.hover_image = (
-            self.hover_transform_strategy.transform(self.original_image)
-            if self.hover_transform_strategy else self.original_image
-        )
-        self.click_image = (
-            self.click_transform_strategy.transform(self.original_image)
-            if self.click_transform_strategy else self.original_image
-        )
+        self.original_image = self.image
+        self.rect = self.image.get_rect(topleft=self.position)
+        self.hover_image = self._transform(self.hover_transform_strategy)
+        self.click_image = self._transform(self.click_transform_strategy)
+        self.relayout()
+
+    def _transform(self, strategy: Optional[ImageTransformStrategy]) -> pygame.Surface:
+        if strategy is None:
+            return self.original_image
+        return memoized(strategy, persistent=True).transform(self.original_image)
 
     def get_size(self,text:Optional[SimpleText],image: Optional[pygame.Surface],padding: Tuple[int,int]) -> Tuple[int, int]:
         if image is not None:
@@ -59,6 +58,15 @@ class Button(UIElement):
         return 100, 100
 
     def get_image(self,text:Optional[SimpleText],image: Optional[pygame.Surface], background_color: Optional[Tuple[int,int,int]],padding: Tuple[int,int]) -> pygame.Surface:
+        if text is None or image is not None:
+            return self._compose(text, image, background_color, padding)
+        variants = Button._composed.setdefault(text.image, {})
+        key = (tuple(background_color) if background_color else None, tuple(padding))
+        if key not in variants:
+            variants[key] = self._compose(text, image, background_color, padding)
+        return variants[key]
+
+    def _compose(self,text:Optional[SimpleText],image: Optional[pygame.Surface], background_color: Optional[Tuple[int,int,int]],padding: Tuple[int,int]) -> pygame.Surface:
         bg = pygame.Surface(self.get_size(text,image,padding), pygame.SRCALPHA)
         if background_color is not None:
             bg.fill(background_color)
@@ -94,7 +102,8 @@ class Button(UIElement):
 
     def check_for_input(self, mause_position: Tuple[int, int]) -> bool:
         if self.enabled:
-            if self.rect.collidepoint(mause_position):
+            # bounds() segue position mesmo antes do primeiro render, que é quando o rect é reposicionado
+            if self.bounds().collidepoint(mause_position):
                 return True
         return False
 
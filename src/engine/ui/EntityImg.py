@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Tuple, Optional, Any
 
 import pygame
 
@@ -8,6 +8,9 @@ from src.engine.ui.UIElement import UIElement
 
 
 class EntityImg(UIElement):
+    # continua com update por frame para acompanhar a vida da entidade
+    event_types = frozenset({pygame.MOUSEBUTTONDOWN})
+
     def __init__(self,entity,position,on_click):
         super().__init__(entity.image,position)
         self.entity = entity
@@ -33,6 +36,12 @@ class EntityImg(UIElement):
             if self.on_click:
                 self.on_click(self.entity)
 
+    def bounds(self) -> Optional[pygame.Rect]:
+        return super().bounds().union(self.life_bar.bounds())
+
+    def render_state(self) -> Any:
+        return super().render_state(), self.targeted, self.entity.dead, self.life_bar.render_state()
+
     def render(self, surface: pygame.Surface):
         super().render(surface)
         self.life_bar.render(surface)
@@ -1,26 +1,66 @@
 from abc import ABC, abstractmethod
+from typing import Tuple, Any, Dict
+from weakref import WeakKeyDictionary
 
+import numpy as np
 import pygame
 
+from src.engine.assets.derived import DERIVED
 from src.utils import print_debug
 
 
+def _alpha_copy(image: pygame.Surface) -> pygame.Surface:
+    # convert_alpha já devolve uma cópia, mas precisa do display
+    if pygame.display.get_surface() is not None:
+        return image.convert_alpha()
+    return image.copy()
+
+
 class ImageTransformStrategy(ABC):
     @abstractmethod
     def transform(self, image: pygame.Surface) -> pygame.Surface:
         pass
 
+    def cache_key(self) -> Tuple[Any, ...]:
+        # identifica a transformação e seus parâmetros nos caches de imagens derivadas
+        return (type(self).__name__,) + tuple(sorted(vars(self).items()))
+
 class ColorInverter(ImageTransformStrategy):
     def transform(self, image: pygame.Surface) -> pygame.Surface:
-        inverted = image.convert_alpha().copy()
+        inverted = _alpha_copy(image)
         arr = pygame.surfarray.pixels3d(inverted)
-        arr[:] = 255 - arr
+        np.subtract(255, arr, out=arr)
         del arr
         return inverted
 
 
+class CircleMask(ImageTransformStrategy):
+    def __init__(self, radius: int):
+        self.radius = radius
+
+    def transform(self, image: pygame.Surface) -> pygame.Surface:
+        masked = _alpha_copy(image)
+        w, h = masked.get_size()
+
+        # Surface com alpha
+        mask_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        mask_surface.fill((0, 0, 0, 255))  # tudo preto
+
+        # Desenha o círculo transparente (área visível)
+        pygame.draw.circle(
+            mask_surface,
+            (0, 0, 0, 0),  # alpha 0 = transparente
+            (w // 2, h // 2),
+            self.radius
+        )
+
+        # Aplica a máscara
+        masked.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        return masked
+
+
 class BrightnessTransform(ImageTransformStrategy):
-    def __init__(self, intensity: int):
+    def __init__(self, intensity: float):
         """
         intensity: valor entre -1 e 1
         positivo  -> aumenta brilho
@@ -29,21 +69,93 @@ class BrightnessTransform(ImageTransformStrategy):
         self.intensity = intensity * 255
 
     def transform(self, image: pygame.Surface) -> pygame.Surface:
-        new_image = image.copy()
+        bright = _alpha_copy(image)
+        arr = pygame.surfarray.pixels3d(bright)
+        arr[:] = np.clip(arr.astype(np.int16) + int(self.intensity), 0, 255)
+        del arr
+        return bright
 
-        bright = new_image.convert_alpha()
-        width, height = bright.get_size()
 
+class TintTransform(ImageTransformStrategy):
+    def __init__(self, color: Tuple[int, int, int], strength: float = 0.5):
+        """
+        color: cor do tingimento
+        strength: 0 mantém a imagem, 1 pinta tudo com a cor
+        """
+        self.color = tuple(color)
+        self.strength = strength
 
+    def transform(self, image: pygame.Surface) -> pygame.Surface:
+        tinted = _alpha_copy(image)
+        arr = pygame.surfarray.pixels3d(tinted)
+        color = np.array(self.color, dtype=np.float32)
+        arr[:] = (arr * (1 - self.strength) + color * self.strength).astype(np.uint8)
+        del arr
+        return tinted
 
-        for x in range(width):
-            for y in range(height):
-                r, g, b, a = bright.get_at((x, y))
 
-                r = max(0, min(255, r + self.intensity))
-                g = max(0, min(255, g + self.intensity))
-                b = max(0, min(255, b + self.intensity))
+class GrayscaleTransform(ImageTransformStrategy):
+    def transform(self, image: pygame.Surface) -> pygame.Surface:
+        gray = _alpha_copy(image)
+        arr = pygame.surfarray.pixels3d(gray)
+        # luminância perceptual (BT.601)
+        luminance = arr @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+        arr[:] = luminance.astype(np.uint8)[..., np.newaxis]
+        del arr
+        return gray
 
-                bright.set_at((x, y), (r, g, b, a))
 
-        return bright
+class AlphaFade(ImageTransformStrategy):
+    def __init__(self, alpha: float):
+        """
+        alpha: fator multiplicado no canal alpha, entre 0 (invisível) e 1 (sem mudança)
+        """
+        self.alpha = alpha
+
+    def transform(self, image: pygame.Surface) -> pygame.Surface:
+        faded = _alpha_copy(image)
+        arr = pygame.surfarray.pixels_alpha(faded)
+        arr[:] = (arr * self.alpha).astype(np.uint8)
+        del arr
+        return faded
+
+
+class MemoizedTransform(ImageTransformStrategy):
+    """
+    Guarda o resultado da estratégia por surface de origem (identidade) e parâmetros.
+    O memo é compartilhado entre todas as instâncias e some junto com a surface de origem.
+    persistent=True passa os misses pelo cache de derivadas em disco.
+    """
+    _results: "WeakKeyDictionary[pygame.Surface, Dict[Tuple[Any, ...], pygame.Surface]]" = WeakKeyDictionary()
+    hits = 0
+    misses = 0
+
+    def __init__(self, strategy: ImageTransformStrategy, persistent: bool = False):
+        self.strategy = strategy
+        self.persistent = persistent
+
+    def cache_key(self) -> Tuple[Any, ...]:
+        return self.strategy.cache_key()
+
+    def transform(self, image: pygame.Surface) -> pygame.Surface:
+        results = MemoizedTransform._results.setdefault(image, {})
+        key = self.strategy.cache_key()
+        result = results.get(key)
+        if result is not None:
+            MemoizedTransform.hits += 1
+            return result
+
+        MemoizedTransform.misses += 1
+        if self.persistent:
+            result = DERIVED.transform(image, self.strategy)
+            result = result.convert_alpha() if pygame.display.get_surface() is not None else result
+        else:
+            result = self.strategy.transform(image)
+        results[key] = result
+        return result
+
+
+def memoized(strategy: ImageTransformStrategy, persistent: bool = False) -> MemoizedTransform:
+    if isinstance(strategy, MemoizedTransform):
+        return strategy
+    return MemoizedTransform(strategy, persistent)
@@ -32,6 +32,11 @@ class RadioButton:
         if self.selected:
             pygame.draw.circle(surface, self.color, self._get_sphere_center(), self.radius - 1, width=0)
 
+    def bounds(self) -> pygame.Rect:
+        center = self._get_sphere_center()
+        circle = pygame.Rect(center[0] - self.radius, center[1] - self.radius, self.radius * 2, self.radius * 2)
+        return circle.unionall([self.rect, self._text.bounds()])
+
     def _get_sphere_center(self) -> Tuple[int, int]:
         return self.position[0], self.position[1]
 
@@ -55,6 +60,9 @@ class RadioButton:
 
 
 class RadioButtonGroup(UIElement):
+    event_types = frozenset({pygame.MOUSEBUTTONDOWN})
+    frame_update = False
+
     def __init__(self,position: Tuple[int, int],options: List[Tuple[str,Any]],multiselect: int = 1,gap:int = 24,color: Tuple[int,int,int] = (255,255,255),radius: int = 6,text_size: int = 12,label_str: Optional[str] = None,label_size: int = 12,on_change: Optional[Callable[[Any,Any],None]] = None):
         super().__init__(None,position)
         self.multiselect = multiselect
@@ -80,6 +88,7 @@ class RadioButtonGroup(UIElement):
     def set_options(self,options: List[Tuple[str,Any]]) -> None:
         self.clear()
         self.radio_buttons = self._initialize_radio_buttons(options)
+        self.relayout()
 
     def update(self, event: pygame.event.Event, mouse_position: Tuple[int, int]):
         if not self.enabled:
@@ -143,6 +152,17 @@ class RadioButtonGroup(UIElement):
                 if radio_button:
                     radio_button.selected = False
 
+    def bounds(self) -> Optional[pygame.Rect]:
+        rects = [radio_button.bounds() for radio_button in self.radio_buttons] + ([self.label.bounds()] if self.label else [])
+        return rects[0].unionall(rects[1:]) if rects else self.rect.copy()
+
+    def render_state(self) -> Any:
+        return (
+            self.visible,
+            self.label.render_state() if self.label else None,
+            tuple((radio_button, radio_button.selected) for radio_button in self.radio_buttons)
+        )
+
     def render(self,surface: pygame.Surface):
         if not self.visible:
             return
@@ -159,9 +179,16 @@ class RadioButtonGroup(UIElement):
             radio_button.selected = False
 
     def _get_clicked_radio_button(self,mouse_position: Tuple[int, int]) -> Optional[RadioButton]:
-        for radio_button in self.radio_buttons:
-            if radio_button.rect.collidepoint(mouse_position):
-                return radio_button
+        # os botões ficam numa coluna com espaçamento fixo: a linha sai direto da altura do clique
+        if not self.radio_buttons:
+            return None
+        gap = self.radio_config["gap"]
+        first = self.radio_buttons[0]
+        row = (mouse_position[1] - first.position[1]) // gap
+        span = first.rect.height // gap
+        for i in range(max(0, row - span), min(row + 1, len(self.radio_buttons))):
+            if self.radio_buttons[i].rect.collidepoint(mouse_position):
+                return self.radio_buttons[i]
         return None
 
     def _is_multiselect(self) -> bool:
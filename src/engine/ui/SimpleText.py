@@ -2,11 +2,15 @@ from typing import Tuple
 
 import pygame
 
+from src.engine.ui.TextCache import TEXT_CACHE
 from src.engine.ui.UIElement import UIElement
 from src.utils import get_default_font
 
 
 class SimpleText(UIElement):
+    event_types = frozenset()
+    frame_update = False
+
     def update(self, event: pygame.event.Event, mouse_position: Tuple[int, int]):
         pass
 
@@ -14,7 +18,7 @@ class SimpleText(UIElement):
         self.font = get_default_font(size)
         self.text = text
         self.text_color = text_color
-        self.image = self.font.render(self.text, True, self.text_color)
+        self.image = TEXT_CACHE.render(self.font, self.text, self.text_color)
         self.position = position
         super().__init__(self.image, self.position)
 
@@ -22,5 +26,7 @@ class SimpleText(UIElement):
         surface.blit(self.image,self.position)
 
     def change_text(self,text: str):
+        if text == self.text:
+            return
         self.text = text
-        self.image = self.font.render(text, True, self.text_color)
+        self.image = TEXT_CACHE.render(self.font, text, self.text_color)
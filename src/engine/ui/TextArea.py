@@ -1,12 +1,17 @@
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Any
 
 import pygame
 
+from src.engine.ui.Transcript import Transcript
 from src.engine.ui.UIElement import UIElement
+from src.engine.ui.WrappedText import WrappedText
 from src.utils import get_default_font
 
 
 class TextAreaShow(UIElement):
+    event_types = frozenset({pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL})
+    frame_update = False
+    focusable = True
 
     def __init__(self, position: Tuple[int, int],width:int,height:int,text:str="",text_size:int = 12,padding:int = 12,background_color:Tuple[int,int,int] = (0,0,0),border_color:Tuple[int,int,int] = (255,255,255),text_color:Tuple[int,int,int]= (255,255,255)):
         super().__init__(None, position)
@@ -16,29 +21,86 @@ class TextAreaShow(UIElement):
         self.background_color = background_color
         self.border_color = border_color
         self.rect = pygame.rect.Rect(self.position[0],self.position[1],self.width,self.height)
-        self.text = text
         self.text_color = text_color
         self.font = get_default_font(text_size)
+        # o transcript guarda tudo; o wrapped só a janela que começa no parágrafo window_start
+        self.transcript = Transcript(text)
+        self.window_start = self.transcript.spilled
+        self.wrapped = WrappedText(self.font, self.width - 2 * self.padding, self._window_text())
         self.scroll_offset = 0
         self.focused = False
+        # viewport composto: só as linhas que mudaram desde o último frame são renderizadas
+        self._viewport: Optional[pygame.Surface] = None
+        self._viewport_layout: Optional[Tuple] = None
+        self._viewport_lines: List[Optional[str]] = []
+        self._viewport_offset = 0
+        self.rendered_lines = 0
+        self.revision = 0
+
+    @property
+    def text(self) -> str:
+        return self.transcript.text
+
+    @text.setter
+    def text(self, text: str):
+        current = self.transcript.text
+        if text.startswith(current):
+            self.append_text(text[len(current):])
+            return
+        self.transcript.close()
+        self.transcript = Transcript(text)
+        self.window_start = self.transcript.spilled
+        self.wrapped.set_text(self._window_text())
+        self.scroll_offset = 0
+        self.revision += 1
+
+    def append_text(self, text: str):
+        # quem está no fim acompanha o texto novo, como num log de chat; quem rolou para trás fica onde está
+        following = self.scroll_offset >= self.wrapped.max_scroll(self._visible_line_count())
+        self.transcript.append(text)
+        self.wrapped.append(text)
+        if following:
+            self.scroll_offset = self.wrapped.max_scroll(self._visible_line_count())
+        self._trim_window()
+        self.revision += 1
+
+    def _window_text(self) -> str:
+        return "\n".join(self.transcript.paragraphs(self.window_start, self.transcript.paragraph_count))
+
+    def _trim_window(self):
+        # descarta o início da janela quando ele já saiu da tela por cima; com a leitura parada nele,
+        # espera até scrollback parágrafos a mais e descarta mesmo assim, com a rolagem presa no novo início
+        # (voltar recarrega pela _load_previous_page): a memória fica limitada em qualquer posição
+        excess = self.wrapped.paragraph_count - self.transcript.scrollback - self.transcript.page
+        if excess <= 0:
+            return
+        if self.wrapped.head_lines(excess) > self.scroll_offset and excess < self.transcript.scrollback:
+            return
+        self.scroll_offset = max(0, self.scroll_offset - self.wrapped.drop_head(excess))
+        self.window_start += excess
 
-    def _wrap_text(self) -> List[str]:
-        lines: List[str] = []
-        for paragraph in self.text.split("\n"):
-            words = paragraph.split(" ")
-            current_line = ""
+    def _load_previous_page(self) -> bool:
+        if self.window_start <= 0:
+            return False
+        start = max(0, self.window_start - self.transcript.page)
+        self.scroll_offset += self.wrapped.prepend(self.transcript.paragraphs(start, self.window_start))
+        self.window_start = start
+        return True
 
-            for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                if self.font.size(test_line)[0] <= self.width - 2 * self.padding:
-                    current_line = test_line
-                else:
-                    lines.append(current_line)
-                    current_line = word
+    def _visible_line_count(self) -> int:
+        return (self.height - 2 * self.padding) // self.font.get_height()
+
+    def has_focus(self) -> bool:
+        return self.focused
 
-            lines.append(current_line)
+    def set_focus(self, focused: bool):
+        self.focused = focused
 
-        return lines
+    def bounds(self) -> Optional[pygame.Rect]:
+        return self.rect.copy()
+
+    def render_state(self) -> Any:
+        return self.visible, self.revision, self.scroll_offset, self.font, tuple(self.rect)
 
     def render(self, surface: pygame.Surface):
         if not self.visible:
@@ -50,17 +112,45 @@ class TextAreaShow(UIElement):
         pygame.draw.rect(surface, self.border_color, self.rect, 2)
 
         # Texto
-        lines = self._wrap_text()
-        line_height = self.font.get_height()
-
-        max_visible_lines = (self.height - 2 * self.padding) // line_height
-        visible_lines = lines[self.scroll_offset:self.scroll_offset + max_visible_lines]
+        surface.blit(self._render_viewport(), (self.rect.x + self.padding, self.rect.y + self.padding))
 
-        y = self.rect.y + self.padding
-        for line in visible_lines:
-            text_surf = self.font.render(line, True, self.text_color)
-            surface.blit(text_surf, (self.rect.x + self.padding, y))
-            y += line_height
+    def _render_viewport(self) -> pygame.Surface:
+        self.wrapped.set_layout(self.font, self.width - 2 * self.padding)
+        line_height = self.font.get_height()
+        rows = self._visible_line_count()
+        size = (self.width - 2 * self.padding, rows * line_height)
+
+        layout = (self.font, size, tuple(self.background_color), tuple(self.text_color))
+        if self._viewport is None or self._viewport_layout != layout:
+            self._viewport = pygame.Surface(size)
+            self._viewport.fill(self.background_color)
+            self._viewport_layout = layout
+            self._viewport_lines = [None] * rows
+        else:
+            # rolagem: desloca os pixels já desenhados e marca só as linhas expostas
+            shift = self.scroll_offset - self._viewport_offset
+            if 0 < abs(shift) < rows:
+                self._viewport.scroll(0, -shift * line_height)
+                if shift > 0:
+                    self._viewport_lines = self._viewport_lines[shift:] + [None] * shift
+                else:
+                    self._viewport_lines = [None] * -shift + self._viewport_lines[:shift]
+            elif shift:
+                self._viewport_lines = [None] * rows
+        self._viewport_offset = self.scroll_offset
+
+        visible_lines = self.wrapped.lines(self.scroll_offset, rows)
+        for row in range(rows):
+            line = visible_lines[row] if row < len(visible_lines) else ""
+            if self._viewport_lines[row] == line:
+                continue
+            row_rect = pygame.Rect(0, row * line_height, size[0], line_height)
+            self._viewport.fill(self.background_color, row_rect)
+            if line:
+                self._viewport.blit(self.font.render(line, True, self.text_color), row_rect)
+                self.rendered_lines += 1
+            self._viewport_lines[row] = line
+        return self._viewport
 
     def update(self, event: pygame.event.Event, mouse_position: Tuple[int, int]):
         if event is None:
@@ -75,14 +165,13 @@ class TextAreaShow(UIElement):
 
 
         if event.type == pygame.MOUSEWHEEL:
-            lines = self._wrap_text()
-            total_lines = len(lines)
-            line_height = self.font.get_height()
-            visible_lines = (self.height - 2 * self.padding) // line_height
-            max_scroll_offset = max(0, total_lines - visible_lines)
+            max_scroll_offset = self.wrapped.max_scroll(self._visible_line_count())
             if event.y == 1:
                 if self.scroll_offset < max_scroll_offset:
                     self.scroll_offset+=1
+                    self._trim_window()
             elif event.y == -1:
+                if self.scroll_offset == 0:
+                    self._load_previous_page()
                 if self.scroll_offset > 0:
                     self.scroll_offset -= 1
\ No newline at end of file
@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Tuple, Dict, Any
+
+import pygame
+
+from src.constants import TEXT_CACHE_MAX_ENTRIES
+
+
+class TextCache:
+    """
+    Cache LRU de textos renderizados, compartilhado por todos os elementos de texto.
+    A chave é (fonte, texto, cor, antialias); as surfaces retornadas são compartilhadas
+    e não devem ser alteradas por quem as recebe.
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[Tuple[Any, ...], pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, ...], antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+        }
+
+
+TEXT_CACHE = TextCache()
@@ -1,4 +1,4 @@
-from typing import Tuple, Callable, Optional
+from typing import Tuple, Callable, Optional, Any
 
 import pygame
 
@@ -8,6 +8,10 @@ from src.utils import get_default_font, typewriter_sound
 
 
 class TextInput(UIElement):
+    event_types = frozenset({pygame.MOUSEBUTTONDOWN, pygame.TEXTINPUT, pygame.KEYDOWN})
+    frame_update = False
+    focusable = True
+
     def __init__(self, position: Tuple[int,int], width: int,height:int = 24,initial_text:str="", background_color:Tuple[int,int,int] = (255, 255, 255),focus_background_color:Tuple[int,int,int] = (50, 100, 255),text_size:int = 12, text_color:Tuple[int,int,int] = (255, 255, 255), padding: int = 3, border_width = 1,label_str: str = None,label_top: bool=True,label_size:int = 24,on_change: Optional[Callable[[str],None]] = None,on_submit: Optional[Callable[[str],None]] = None):
         super().__init__(None,position)
         self.background_color = background_color
@@ -32,11 +36,27 @@ class TextInput(UIElement):
                 text=label_str
             )
 
+    def has_focus(self) -> bool:
+        return self.focus
+
+    def set_focus(self, focused: bool):
+        self.focus = focused
+        if focused:
+            pygame.key.start_text_input()
+        else:
+            pygame.key.stop_text_input()
+
     def _on_change(self):
         typewriter_sound()
         if self.on_change:
             self.on_change(self.text.text)
 
+    def bounds(self) -> Optional[pygame.Rect]:
+        return self.rect.unionall([element.bounds() for element in (self.text, self.label) if element is not None])
+
+    def render_state(self) -> Any:
+        return self.visible, self.focus, self.text.render_state(), self.label.render_state() if self.label else None
+
     def render(self, surface: pygame.Surface):
         if not self.visible:
             return
@@ -0,0 +1,102 @@
+import mmap
+import tempfile
+from array import array
+from collections import deque
+from typing import List, Deque, Optional, Dict, Any, IO
+
+from src.constants import TRANSCRIPT_SCROLLBACK, TRANSCRIPT_PAGE
+
+
+class Transcript:
+    """
+    Histórico de texto dividido em parágrafos, que só cresce pelo final.
+    O parágrafo aberto é uma lista de pedaços, então um append custa O(1).
+    Os parágrafos fechados ficam em memória até passarem de scrollback; os mais antigos
+    vão, de page em page, para um arquivo temporário só de append, lido de volta por mmap
+    através de um índice de offsets.
+    """
+
+    def __init__(self, text: str = "", scrollback: int = TRANSCRIPT_SCROLLBACK, page: int = TRANSCRIPT_PAGE):
+        self.scrollback = scrollback
+        self.page = page
+        self._chunks: List[str] = []
+        self._paragraphs: Deque[str] = deque()
+        # offset de início de cada parágrafo no arquivo, o último é o fim do arquivo
+        self._offsets = array("Q", [0])
+        self._file: Optional[IO[bytes]] = None
+        self._map: Optional[mmap.mmap] = None
+        self.append(text)
+
+    @property
+    def spilled(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def paragraph_count(self) -> int:
+        return self.spilled + len(self._paragraphs) + 1
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.paragraphs(0, self.paragraph_count))
+
+    def append(self, text: str):
+        if "\n" not in text:
+            if text:
+                self._chunks.append(text)
+            return
+        fragments = text.split("\n")
+        self._chunks.append(fragments[0])
+        for fragment in fragments[1:]:
+            self._paragraphs.append("".join(self._chunks))
+            self._chunks = [fragment]
+        if len(self._paragraphs) > self.scrollback + self.page:
+            self._spill(len(self._paragraphs) - self.scrollback)
+
+    def paragraph(self, i: int) -> str:
+        if i < self.spilled:
+            return self._mapped()[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+        i -= self.spilled
+        if i < len(self._paragraphs):
+            return self._paragraphs[i]
+        return "".join(self._chunks)
+
+    def paragraphs(self, start: int, end: int) -> List[str]:
+        return [self.paragraph(i) for i in range(max(0, start), min(end, self.paragraph_count))]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "paragraphs": self.paragraph_count,
+            "in_memory": len(self._paragraphs) + 1,
+            "spilled": self.spilled,
+            "disk_bytes": self._offsets[-1],
+        }
+
+    def _spill(self, count: int):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="grass_transcript_")
+        self._file.seek(0, 2)
+        for _ in range(count):
+            data = self._paragraphs.popleft().encode("utf-8")
+            self._file.write(data)
+            self._offsets.append(self._offsets[-1] + len(data))
+        self._file.flush()
+        # o mapa tem tamanho fixo, é refeito na próxima leitura
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def __del__(self):
+        self.close()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Any
 import pygame
 from src.engine.scene.SceneElement import SceneElement
 from src.utils import print_debug
@@ -21,9 +21,20 @@ class UIElement(SceneElement, ABC):
 
 
 
+    def bounds(self) -> Optional[pygame.Rect]:
+        if self.image is not None:
+            return self.image.get_rect(topleft=self.position)
+        return self.rect.copy() if self.rect is not None else None
+
+    def render_state(self) -> Any:
+        return self.visible, self.image, tuple(self.position)
+
     def set_image(self, image: pygame.Surface):
+        resized = self.image is None or self.image.get_size() != image.get_size()
         self.image = image
         self.rect = self.image.get_rect(topleft=self.position)
+        if resized:
+            self.relayout()
 
     @abstractmethod
     def update(self,event: pygame.event.Event,mouse_position: Tuple[int, int]):
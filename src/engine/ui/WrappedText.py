@@ -0,0 +1,121 @@
+from typing import List
+
+import pygame
+
+
+class WrappedText:
+    """
+    Modelo de linhas quebradas de um texto que cresce pelo final.
+    Parágrafos fechados nunca são reprocessados: um append só refaz a última linha
+    do último parágrafo, porque a quebra gulosa não muda as linhas anteriores.
+    Tudo é refeito apenas quando a fonte ou a largura mudam.
+    Parágrafos antigos podem ser descartados do início (drop_head) e recarregados (prepend),
+    para manter em memória só uma janela do histórico.
+    """
+
+    def __init__(self, font: pygame.font.Font, width: int, text: str = ""):
+        self.font = font
+        self.width = width
+        self.set_text(text)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._paragraphs + [" ".join(self._tail_words)])
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    @property
+    def paragraph_count(self) -> int:
+        return len(self._paragraphs) + 1
+
+    def head_lines(self, paragraphs: int) -> int:
+        # número de linhas ocupadas pelos primeiros parágrafos fechados
+        return self._starts[min(paragraphs, len(self._paragraphs))]
+
+    def lines(self, start: int = 0, count: int = None) -> List[str]:
+        return self._lines[start:] if count is None else self._lines[start:start + count]
+
+    def max_scroll(self, visible_lines: int) -> int:
+        return max(0, len(self._lines) - visible_lines)
+
+    def set_text(self, text: str):
+        self._paragraphs: List[str] = []
+        self._lines: List[str] = []
+        self._starts: List[int] = []
+        self._start_paragraph()
+        self.append(text)
+
+    def set_layout(self, font: pygame.font.Font, width: int):
+        if font is self.font and width == self.width:
+            return
+        self.font = font
+        self.width = width
+        self.set_text(self.text)
+
+    def append(self, text: str):
+        fragments = text.split("\n")
+        self._extend_tail(fragments[0])
+        for fragment in fragments[1:]:
+            self._paragraphs.append(" ".join(self._tail_words))
+            self._start_paragraph()
+            self._extend_tail(fragment)
+
+    def drop_head(self, paragraphs: int) -> int:
+        paragraphs = min(paragraphs, len(self._paragraphs))
+        if paragraphs <= 0:
+            return 0
+        removed = self._starts[paragraphs]
+        del self._paragraphs[:paragraphs]
+        del self._lines[:removed]
+        self._starts = [start - removed for start in self._starts[paragraphs:]]
+        self._line_index -= removed
+        return removed
+
+    def prepend(self, paragraphs: List[str]) -> int:
+        if not paragraphs:
+            return 0
+        head = WrappedText(self.font, self.width, "\n".join(paragraphs))
+        added = len(head._lines)
+        self._paragraphs[:0] = paragraphs
+        self._lines[:0] = head._lines
+        self._starts = head._starts + [start + added for start in self._starts]
+        self._line_index += added
+        return added
+
+    def _start_paragraph(self):
+        self._starts.append(len(self._lines))
+        self._tail_words: List[str] = [""]
+        # a última linha começa na palavra _line_word (-1 = primeira linha do parágrafo)
+        self._line_word = -1
+        self._line_index = len(self._lines)
+        self._lines.append("")
+
+    def _extend_tail(self, fragment: str):
+        if not fragment:
+            return
+        words = fragment.split(" ")
+        self._tail_words[-1] += words[0]
+        self._tail_words.extend(words[1:])
+        self._wrap_tail()
+
+    def _wrap_tail(self):
+        words = self._tail_words
+        if self._line_word < 0:
+            current_line, start = "", 0
+        else:
+            current_line, start = words[self._line_word], self._line_word + 1
+
+        del self._lines[self._line_index:]
+        for i in range(start, len(words)):
+            test_line = current_line + (" " if current_line else "") + words[i]
+            if self.font.size(test_line)[0] <= self.width:
+                current_line = test_line
+            else:
+                self._lines.append(current_line)
+                current_line = words[i]
+                self._line_word = i
+
+        self._line_index = len(self._lines)
+        self._lines.append(current_line)
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Relatório de custo de importação por módulo (self e cumulativo, em microssegundos),
+# usando o -X importtime do próprio Python num processo limpo.
+# Uso: python -m src.importtime [modulo] [top]
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_report(module: str) -> List[Tuple[str, int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
+
+
+def print_report(module: str, top: int = 25):
+    rows = import_report(module)
+    total = max((row[2] for row in rows), default=0)
+    print(f"{module}: {total / 1000:.1f} ms cumulative")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us in rows[:top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+
+if __name__ == "__main__":
+    print_report(
+        sys.argv[1] if len(sys.argv) > 1 else "src.engine.ai.chat",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    )
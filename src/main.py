@@ -7,5 +7,5 @@ from src.model.scenario import DEFAULT_SCENARIO, DEBUG_SCENARIO
 if __name__ == "__main__":
     pygame.init()
     game = Game(DEFAULT_SCENARIO if not DEBUG else DEBUG_SCENARIO)
-    game.main_menu()
+    game.loading_screen()
     game.start()
\ No newline at end of file
@@ -2,12 +2,12 @@ import os.path
 from enum import Enum
 from typing import Optional, List, Callable, Dict
 
-import pygame.image
+import pygame
 
+from src.engine.assets.manager import ASSETS
 from src.model.effects import OnAttackEvent
 from src.model.entity import Entity, DamageType
 from src.model.player import Player
-from src.utils import get_assets_path
 
 
 class EquipSlot(str, Enum):
@@ -26,10 +26,12 @@ class GenericItem:
         self.name = name
         self.description = description
         self.value = value
-        self.image = pygame.image.load(os.path.join(get_assets_path(), "items", image)) if image else None
+        self.image_str = image if image else "generic.png"
         self.useless = useless
-        if self.image is None:
-            self.image = pygame.image.load(os.path.join(get_assets_path(), "items", "generic.png"))
+
+    @property
+    def image(self) -> pygame.Surface:
+        return ASSETS.image(os.path.join("items", self.image_str))
 
     def __eq__(self, other):
         if isinstance(other, GenericItem):
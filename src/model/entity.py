@@ -4,12 +4,13 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional, TYPE_CHECKING, Dict
 
-import pygame.image
+import pygame
 
 from src.constants import IMAGE_SIZE
+from src.engine.assets.manager import ASSETS
 from src.model.attribs import CharacterAttrib, fill_missing_attribs
 from src.model.effects import EffectEnum, EFFECTS
-from src.utils import print_debug, get_mod, get_assets_path
+from src.utils import print_debug, get_mod
 
 if TYPE_CHECKING:
     from src.model.monster import EnemyEnum
@@ -67,9 +68,14 @@ class Entity(Damageable):
         self.base_damage = base_damage
         self.type = type
         self.category = category
-        self.image = None
-        if image_str is not None:
-            self.image = pygame.transform.scale(pygame.image.load(os.path.join(get_assets_path(),"entities",image_str)), IMAGE_SIZE)
+        self.image_str = image_str
+
+    @property
+    def image(self) -> Optional[pygame.Surface]:
+        # carregada sob demanda, importar monster.py não decodifica nenhum retrato
+        if self.image_str is None:
+            return None
+        return ASSETS.image(os.path.join("entities",self.image_str), IMAGE_SIZE)
 
     def get_spell_difficult_class(self):
         return 10 + get_mod(self.attributes[CharacterAttrib.INTELLIGENCE])
@@ -1,12 +1,12 @@
 import os
-import random
 import sys
 from typing import AnyStr
 
-import numpy as np
 import pygame
 
-from src.constants import DEBUG
+from src.constants import DEBUG, PRELOAD_FONT_SIZES
+from src.engine.assets.fonts import FONTS
+from src.engine.assets.sounds import TYPEWRITER
 
 
 
@@ -21,8 +21,14 @@ def get_assets_path() -> AnyStr:
 
     return os.path.join(project_root, "assets")
 
-def get_default_font(size:int) -> pygame.font.Font:
-    return pygame.font.Font(os.path.join(get_assets_path(), "font.ttf"), size)
+def get_default_font_path() -> AnyStr:
+    return os.path.join(get_assets_path(), "font.ttf")
+
+def get_default_font(size:int,bold:bool = False,italic:bool = False) -> pygame.font.Font:
+    return FONTS.get(get_default_font_path(), size, bold=bold, italic=italic)
+
+def preload_default_fonts():
+    FONTS.preload(get_default_font_path(), PRELOAD_FONT_SIZES)
 
 def get_image(image:AnyStr)-> pygame.Surface:
     return pygame.image.load(os.path.join(get_assets_path(), image))
@@ -66,22 +72,8 @@ def grid_position(
     return x, y
 
 def typewriter_sound():
-    SAMPLE_RATE = 44100
-    TYPE_VOLUME = 0.4
-
-    duration = random.uniform(0.01, 0.03)
-    samples = int(SAMPLE_RATE * duration)
-
-    # ruído branco
-    noise = np.random.uniform(-1, 1, samples)
-
-    # envelope de ataque rápido
-    envelope = np.linspace(1, 0, samples)
-
-    sound = noise * envelope
-    sound = (sound * 32767 * TYPE_VOLUME).astype(np.int16)
-    sound_stereo = np.column_stack((sound, sound))
-    pygame.sndarray.make_sound(sound_stereo).play()
+    # os cliques são sintetizados uma vez no banco, aqui só tocamos o próximo
+    TYPEWRITER.play()
 
 
 